@@ -0,0 +1,62 @@
+"""Covering and partial indexes for conversation/message list queries.
+
+Revision ID: 20260827_covering_indexes
+Revises: 20260827_uuid_keys
+Create Date: 2026-08-27
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20260827_covering_indexes'
+down_revision: Union[str, None] = '20260827_uuid_keys'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+  """Recreate list indexes with INCLUDE columns and add a session partial index."""
+  op.drop_index('ix_conversations_project_created', table_name='conversations')
+  op.create_index(
+    'ix_conversations_project_created',
+    'conversations',
+    ['project_id', 'created_at'],
+    postgresql_include=['title', 'session_id', 'cluster_id'],
+  )
+
+  op.drop_index('ix_messages_conversation_timestamp', table_name='messages')
+  op.create_index(
+    'ix_messages_conversation_timestamp',
+    'messages',
+    ['conversation_id', 'timestamp'],
+    postgresql_include=['role', 'is_error'],
+  )
+
+  op.create_index(
+    'ix_conversations_active_session',
+    'conversations',
+    ['session_id'],
+    postgresql_where=sa.text('session_id IS NOT NULL'),
+  )
+
+
+def downgrade() -> None:
+  """Restore the plain two-column indexes."""
+  op.drop_index('ix_conversations_active_session', table_name='conversations')
+
+  op.drop_index('ix_messages_conversation_timestamp', table_name='messages')
+  op.create_index(
+    'ix_messages_conversation_timestamp',
+    'messages',
+    ['conversation_id', 'timestamp'],
+  )
+
+  op.drop_index('ix_conversations_project_created', table_name='conversations')
+  op.create_index(
+    'ix_conversations_project_created',
+    'conversations',
+    ['project_id', 'created_at'],
+  )
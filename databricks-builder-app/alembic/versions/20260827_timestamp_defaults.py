@@ -0,0 +1,36 @@
+"""Add server-side now() defaults to timestamp columns.
+
+Revision ID: 20260827_timestamp_defaults
+Revises: 20260827_covering_indexes
+Create Date: 2026-08-27
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20260827_timestamp_defaults'
+down_revision: Union[str, None] = '20260827_covering_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COLUMNS = [
+  ('projects', 'created_at'),
+  ('conversations', 'created_at'),
+  ('messages', 'timestamp'),
+  ('project_backup', 'updated_at'),
+]
+
+
+def upgrade() -> None:
+  """Set DEFAULT now() so inserts no longer need a Python-side timestamp."""
+  for table, column in _COLUMNS:
+    op.alter_column(table, column, server_default=sa.func.now())
+
+
+def downgrade() -> None:
+  """Drop the server-side defaults (application supplies timestamps again)."""
+  for table, column in _COLUMNS:
+    op.alter_column(table, column, server_default=None)
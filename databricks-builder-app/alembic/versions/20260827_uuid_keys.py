@@ -0,0 +1,82 @@
+"""Convert string UUID primary/foreign keys to native uuid columns.
+
+Revision ID: 20260827_uuid_keys
+Revises: 20260115_warehouse_workspace
+Create Date: 2026-08-27
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '20260827_uuid_keys'
+down_revision: Union[str, None] = '20260115_warehouse_workspace'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Every (table, column) pair holding a string UUID
+_COLUMNS = [
+  ('projects', 'id'),
+  ('conversations', 'id'),
+  ('conversations', 'project_id'),
+  ('messages', 'id'),
+  ('messages', 'conversation_id'),
+  ('project_backup', 'project_id'),
+  ('executions', 'id'),
+  ('executions', 'conversation_id'),
+  ('executions', 'project_id'),
+]
+
+# Foreign keys spanning the columns above: (table, column, referred_table,
+# referred_column). Postgres re-validates a foreign key when either side's
+# type changes, which fails while one side is uuid and the other is still
+# varchar — so the FKs are dropped before the type changes and re-created
+# after every column is converted.
+_FOREIGN_KEYS = [
+  ('conversations', 'project_id', 'projects', 'id'),
+  ('messages', 'conversation_id', 'conversations', 'id'),
+  ('project_backup', 'project_id', 'projects', 'id'),
+  ('executions', 'conversation_id', 'conversations', 'id'),
+  ('executions', 'project_id', 'projects', 'id'),
+]
+
+
+def _convert(target_type: sa.types.TypeEngine, cast: str) -> None:
+  """Drop FKs, cast every column to target_type, re-create the FKs."""
+  inspector = sa.inspect(op.get_bind())
+
+  dropped = []
+  for table, column, referred_table, referred_column in _FOREIGN_KEYS:
+    if not inspector.has_table(table):
+      continue
+    for fk in inspector.get_foreign_keys(table):
+      if fk['constrained_columns'] == [column] and fk['name']:
+        op.drop_constraint(fk['name'], table, type_='foreignkey')
+        dropped.append((fk['name'], table, column, referred_table, referred_column))
+
+  for table, column in _COLUMNS:
+    if not inspector.has_table(table):
+      continue
+    op.alter_column(
+      table,
+      column,
+      type_=target_type,
+      postgresql_using=f'{column}::{cast}',
+    )
+
+  for name, table, column, referred_table, referred_column in dropped:
+    op.create_foreign_key(
+      name, table, referred_table, [column], [referred_column], ondelete='CASCADE'
+    )
+
+
+def upgrade() -> None:
+  """Cast string UUID columns to native uuid."""
+  _convert(sa.Uuid(as_uuid=True), 'uuid')
+
+
+def downgrade() -> None:
+  """Cast native uuid columns back to strings."""
+  _convert(sa.String(50), 'text')
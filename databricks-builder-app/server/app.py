@@ -17,13 +17,14 @@ logging.basicConfig(
 
 from dotenv import load_dotenv
 from fastapi import FastAPI, Request
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.cors import CORSMiddleware
 
 from .db import is_postgres_configured, is_dynamic_token_mode, run_migrations, init_database, start_token_refresh, stop_token_refresh
 from .routers import agent_router, clusters_router, config_router, conversations_router, projects_router, skills_router, warehouses_router
+from .services.agent import get_databricks_tools
 from .services.backup_manager import start_backup_worker, stop_backup_worker
 from .services.skills_manager import copy_skills_to_app
 
@@ -47,6 +48,13 @@ async def lifespan(app: FastAPI):
   # Copy skills from databricks-skills to local cache
   copy_skills_to_app()
 
+  # Warm the Databricks MCP tool cache so the first agent request doesn't pay
+  # the import/scan cost inline (runs in a thread; the scan is import-heavy)
+  try:
+    await asyncio.to_thread(get_databricks_tools)
+  except Exception as e:
+    logger.warning(f'Databricks tool preload failed (will load lazily on first request): {e}')
+
   # Initialize database if configured
   db_initialized = False
   if is_postgres_configured():
@@ -90,6 +98,7 @@ app = FastAPI(
   title='Claude Code MCP App',
   description='Project-based Claude Code agent application',
   lifespan=lifespan,
+  default_response_class=ORJSONResponse,
 )
 
 
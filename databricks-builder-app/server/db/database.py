@@ -379,10 +379,13 @@ def init_database(database_url: Optional[str] = None) -> AsyncEngine:
 
     _engine = create_async_engine(
         url,
-        pool_size=int(os.environ.get("DB_POOL_SIZE", "5")),
-        max_overflow=int(os.environ.get("DB_MAX_OVERFLOW", "10")),
-        pool_pre_ping=False,  # Per cookbook
-        pool_recycle=int(os.environ.get("DB_POOL_RECYCLE_INTERVAL", "3600")),
+        # Sized for concurrent SSE sessions: with the defaults (5+10) each
+        # message write waits on a free connection once a handful of streams
+        # run in parallel, and the queued coroutines show up as RSS growth.
+        pool_size=int(os.environ.get("DB_POOL_SIZE", "20")),
+        max_overflow=int(os.environ.get("DB_MAX_OVERFLOW", "20")),
+        pool_pre_ping=True,  # Drop stale connections (OAuth tokens rotate hourly)
+        pool_recycle=int(os.environ.get("DB_POOL_RECYCLE_INTERVAL", "1800")),
         pool_timeout=int(os.environ.get("DB_POOL_TIMEOUT", "10")),
         echo=False,
         connect_args=connect_args,
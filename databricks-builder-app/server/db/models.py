@@ -4,16 +4,24 @@ import uuid
 from datetime import datetime, timezone
 from typing import Any, List, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Index, LargeBinary, String, Text
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+import blosc
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, LargeBinary, String, Text, TypeDecorator, Uuid, func, select, text
+from sqlalchemy.orm import DeclarativeBase, Mapped, column_property, mapped_column, relationship
 
 
-def generate_uuid() -> str:
-  return str(uuid.uuid4())
+_UTC = timezone.utc
 
 
 def utc_now() -> datetime:
-  return datetime.now(timezone.utc)
+  """Current UTC time for Python-side column defaults.
+
+  Most created/updated columns use server_default=func.now() so ordinary
+  inserts skip the Python datetime allocation, but Message.timestamp keeps
+  this Python-side default: Postgres now() is frozen for the whole
+  transaction, so both messages of a turn inserted in one transaction
+  would get the identical timestamp and lose their ordering.
+  """
+  return datetime.now(_UTC)
 
 
 class Base(DeclarativeBase):
@@ -22,21 +30,49 @@ class Base(DeclarativeBase):
   pass
 
 
+class BloscBlob(TypeDecorator):
+  """LargeBinary column transparently compressed with Blosc.
+
+  Blosc's multithreaded zstd codec runs at multiple GB/s, so compressing at
+  the column level is much cheaper than DEFLATE inside zipfile and shrinks
+  the bytes shipped to/from the database.
+  """
+
+  impl = LargeBinary
+  cache_ok = True
+
+  def process_bind_param(self, value: Optional[bytes], dialect) -> Optional[bytes]:
+    if value is None:
+      return None
+    return blosc.compress(value, typesize=1, cname='zstd', clevel=3, shuffle=blosc.SHUFFLE)
+
+  def process_result_value(self, value: Optional[bytes], dialect) -> Optional[bytes]:
+    if value is None:
+      return None
+    try:
+      return blosc.decompress(value)
+    except Exception:
+      # Rows written before column-level compression are raw bytes
+      return value
+
+
 class Project(Base):
   """Project model - user-scoped container for conversations."""
 
   __tablename__ = 'projects'
 
-  id: Mapped[str] = mapped_column(String(50), primary_key=True, default=generate_uuid)
+  id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
   name: Mapped[str] = mapped_column(String(255), nullable=False)
   user_email: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
   created_at: Mapped[datetime] = mapped_column(
-    DateTime(timezone=True), default=utc_now, nullable=False
+    DateTime(timezone=True), server_default=func.now(), nullable=False
   )
 
   # Relationships
+  # lazy='raise' makes an accidental lazy load a loud error instead of a
+  # silent N+1; query sites eager-load with selectinload where needed.
   conversations: Mapped[List['Conversation']] = relationship(
-    'Conversation', back_populates='project', cascade='all, delete-orphan'
+    'Conversation', back_populates='project', cascade='all, delete-orphan', lazy='raise'
   )
 
   __table_args__ = (Index('ix_projects_user_created', 'user_email', 'created_at'),)
@@ -44,11 +80,11 @@ class Project(Base):
   def to_dict(self) -> dict[str, Any]:
     """Convert to dictionary."""
     return {
-      'id': self.id,
+      'id': str(self.id),
       'name': self.name,
       'user_email': self.user_email,
       'created_at': self.created_at.isoformat() if self.created_at else None,
-      'conversation_count': len(self.conversations) if self.conversations else 0,
+      'conversation_count': self.conversation_count,
     }
 
 
@@ -57,13 +93,13 @@ class Conversation(Base):
 
   __tablename__ = 'conversations'
 
-  id: Mapped[str] = mapped_column(String(50), primary_key=True, default=generate_uuid)
-  project_id: Mapped[str] = mapped_column(
-    String(50), ForeignKey('projects.id', ondelete='CASCADE'), nullable=False
+  id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+  project_id: Mapped[uuid.UUID] = mapped_column(
+    Uuid(as_uuid=True), ForeignKey('projects.id', ondelete='CASCADE'), nullable=False
   )
   title: Mapped[str] = mapped_column(String(255), default='New Conversation')
   created_at: Mapped[datetime] = mapped_column(
-    DateTime(timezone=True), default=utc_now, nullable=False
+    DateTime(timezone=True), server_default=func.now(), nullable=False
   )
 
   # Claude agent session ID (for resuming sessions)
@@ -83,18 +119,39 @@ class Conversation(Base):
   workspace_folder: Mapped[Optional[str]] = mapped_column(String(500), nullable=True)
 
   # Relationships
-  project: Mapped['Project'] = relationship('Project', back_populates='conversations')
+  project: Mapped['Project'] = relationship(
+    'Project', back_populates='conversations', lazy='raise'
+  )
   messages: Mapped[List['Message']] = relationship(
-    'Message', back_populates='conversation', cascade='all, delete-orphan'
+    'Message',
+    back_populates='conversation',
+    cascade='all, delete-orphan',
+    lazy='raise',
+    order_by='Message.timestamp',
   )
 
-  __table_args__ = (Index('ix_conversations_project_created', 'project_id', 'created_at'),)
+  __table_args__ = (
+    # INCLUDE the columns list views project so Postgres can answer them
+    # index-only; the partial index serves the session-resume lookup without
+    # indexing the (many) NULL session_ids.
+    Index(
+      'ix_conversations_project_created',
+      'project_id',
+      'created_at',
+      postgresql_include=('title', 'session_id', 'cluster_id'),
+    ),
+    Index(
+      'ix_conversations_active_session',
+      'session_id',
+      postgresql_where=text('session_id IS NOT NULL'),
+    ),
+  )
 
   def to_dict(self) -> dict[str, Any]:
     """Convert to dictionary with messages."""
     return {
-      'id': self.id,
-      'project_id': self.project_id,
+      'id': str(self.id),
+      'project_id': str(self.project_id),
       'title': self.title,
       'created_at': self.created_at.isoformat() if self.created_at else None,
       'session_id': self.session_id,
@@ -109,8 +166,8 @@ class Conversation(Base):
   def to_dict_summary(self) -> dict[str, Any]:
     """Convert to dictionary without messages (for list views)."""
     return {
-      'id': self.id,
-      'project_id': self.project_id,
+      'id': str(self.id),
+      'project_id': str(self.project_id),
       'title': self.title,
       'created_at': self.created_at.isoformat() if self.created_at else None,
       'cluster_id': self.cluster_id,
@@ -118,7 +175,7 @@ class Conversation(Base):
       'default_schema': self.default_schema,
       'warehouse_id': self.warehouse_id,
       'workspace_folder': self.workspace_folder,
-      'message_count': len(self.messages) if self.messages else 0,
+      'message_count': self.message_count,
     }
 
 
@@ -127,27 +184,35 @@ class Message(Base):
 
   __tablename__ = 'messages'
 
-  id: Mapped[str] = mapped_column(String(50), primary_key=True, default=generate_uuid)
-  conversation_id: Mapped[str] = mapped_column(
-    String(50), ForeignKey('conversations.id', ondelete='CASCADE'), nullable=False
+  id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+  conversation_id: Mapped[uuid.UUID] = mapped_column(
+    Uuid(as_uuid=True), ForeignKey('conversations.id', ondelete='CASCADE'), nullable=False
   )
   role: Mapped[str] = mapped_column(String(20), nullable=False)  # "user" or "assistant"
   content: Mapped[str] = mapped_column(Text, nullable=False)
   timestamp: Mapped[datetime] = mapped_column(
-    DateTime(timezone=True), default=utc_now, nullable=False
+    DateTime(timezone=True), default=utc_now, server_default=func.now(), nullable=False
   )
   is_error: Mapped[bool] = mapped_column(Boolean, default=False)
 
   # Relationships
   conversation: Mapped['Conversation'] = relationship('Conversation', back_populates='messages')
 
-  __table_args__ = (Index('ix_messages_conversation_timestamp', 'conversation_id', 'timestamp'),)
+  __table_args__ = (
+    # content stays out of the INCLUDE list to keep the index small
+    Index(
+      'ix_messages_conversation_timestamp',
+      'conversation_id',
+      'timestamp',
+      postgresql_include=('role', 'is_error'),
+    ),
+  )
 
   def to_dict(self) -> dict[str, Any]:
     """Convert to dictionary."""
     return {
-      'id': self.id,
-      'conversation_id': self.conversation_id,
+      'id': str(self.id),
+      'conversation_id': str(self.conversation_id),
       'role': self.role,
       'content': self.content,
       'timestamp': self.timestamp.isoformat() if self.timestamp else None,
@@ -155,17 +220,35 @@ class Message(Base):
     }
 
 
+# SQL-level counts loaded with the row itself, so list views never lazy-load
+# whole collections just to count them (defined here because they reference
+# classes declared above).
+Project.conversation_count = column_property(
+  select(func.count(Conversation.id))
+  .where(Conversation.project_id == Project.id)
+  .correlate_except(Conversation)
+  .scalar_subquery()
+)
+
+Conversation.message_count = column_property(
+  select(func.count(Message.id))
+  .where(Message.conversation_id == Conversation.id)
+  .correlate_except(Message)
+  .scalar_subquery()
+)
+
+
 class ProjectBackup(Base):
   """Stores zipped backup of project files for restore after app restart."""
 
   __tablename__ = 'project_backup'
 
-  project_id: Mapped[str] = mapped_column(
-    String(50), ForeignKey('projects.id', ondelete='CASCADE'), primary_key=True
+  project_id: Mapped[uuid.UUID] = mapped_column(
+    Uuid(as_uuid=True), ForeignKey('projects.id', ondelete='CASCADE'), primary_key=True
   )
-  backup_data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+  backup_data: Mapped[bytes] = mapped_column(BloscBlob, nullable=False)
   updated_at: Mapped[datetime] = mapped_column(
-    DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+    DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
   )
 
 
@@ -178,12 +261,12 @@ class Execution(Base):
 
   __tablename__ = 'executions'
 
-  id: Mapped[str] = mapped_column(String(50), primary_key=True, default=generate_uuid)
-  conversation_id: Mapped[str] = mapped_column(
-    String(50), ForeignKey('conversations.id', ondelete='CASCADE'), nullable=False
+  id: Mapped[uuid.UUID] = mapped_column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
+  conversation_id: Mapped[uuid.UUID] = mapped_column(
+    Uuid(as_uuid=True), ForeignKey('conversations.id', ondelete='CASCADE'), nullable=False
   )
-  project_id: Mapped[str] = mapped_column(
-    String(50), ForeignKey('projects.id', ondelete='CASCADE'), nullable=False
+  project_id: Mapped[uuid.UUID] = mapped_column(
+    Uuid(as_uuid=True), ForeignKey('projects.id', ondelete='CASCADE'), nullable=False
   )
   status: Mapped[str] = mapped_column(
     String(20), nullable=False, default='running'
@@ -193,10 +276,10 @@ class Execution(Base):
   )  # JSON array of events
   error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
   created_at: Mapped[datetime] = mapped_column(
-    DateTime(timezone=True), default=utc_now, nullable=False
+    DateTime(timezone=True), server_default=func.now(), nullable=False
   )
   updated_at: Mapped[datetime] = mapped_column(
-    DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False
+    DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
   )
 
   __table_args__ = (
@@ -208,9 +291,9 @@ class Execution(Base):
     """Convert to dictionary."""
     import json
     return {
-      'id': self.id,
-      'conversation_id': self.conversation_id,
-      'project_id': self.project_id,
+      'id': str(self.id),
+      'conversation_id': str(self.conversation_id),
+      'project_id': str(self.project_id),
       'status': self.status,
       'events': json.loads(self.events_json) if self.events_json else [],
       'error': self.error,
@@ -9,14 +9,20 @@ The async pattern:
 """
 
 import asyncio
-import json
 import logging
+import os
+import time
 from datetime import datetime
+from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import StreamingResponse
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
+from sse_starlette.sse import EventSourceResponse
 
 from ..services.active_stream import get_stream_manager
 from ..services.agent import get_project_directory, stream_agent_response
@@ -32,9 +38,97 @@ router = APIRouter()
 SSE_WINDOW_SECONDS = 50
 
 
-def sse_event(data: dict) -> str:
-    """Format data as SSE event."""
-    return f'data: {json.dumps(data)}\n\n'
+def sse_event(data: dict) -> bytes:
+    """Format data as a pre-framed SSE event.
+
+    Returns bytes so the SSE response can send the frame as-is without a
+    per-chunk str->bytes encode; orjson is much faster than stdlib json on
+    the token-by-token streaming hot path.
+    """
+    return b'data: ' + orjson.dumps(data) + b'\n\n'
+
+
+# Frames that must reach the client immediately, never held in the buffer
+_FLUSH_NOW_PREFIXES = (
+    b'data: {"type":"error"',
+    b'data: {"type":"result"',
+    b'data: {"type":"stream.',
+    b'data: [DONE]',
+)
+
+
+async def _coalesce(inner, max_bytes: int = 4096, max_ms: int = 20):
+    """Buffer small SSE frames and flush on a size or time threshold.
+
+    Every yielded chunk costs a socket write, and token streams produce
+    hundreds of tiny frames. Frames accumulate in a bytearray that is
+    flushed once it reaches max_bytes or max_ms after the first pending
+    frame — far fewer syscalls with no visible latency change. Terminal
+    frames (error/result/stream.*/[DONE]) always flush immediately.
+
+    The inner generator is pumped into a queue by a background task so the
+    flush timer never cancels the generator mid-yield.
+    """
+    events: asyncio.Queue = asyncio.Queue()
+    done = object()
+
+    async def pump():
+        try:
+            async for chunk in inner:
+                events.put_nowait(chunk)
+        except Exception as e:  # re-raised on the consumer side
+            events.put_nowait(e)
+        finally:
+            events.put_nowait(done)
+
+    loop = asyncio.get_running_loop()
+    pump_task = asyncio.create_task(pump())
+    buffer = bytearray()
+    deadline: Optional[float] = None
+    max_s = max_ms / 1000.0
+
+    try:
+        while True:
+            if deadline is None:
+                item = await events.get()
+            else:
+                try:
+                    item = await asyncio.wait_for(events.get(), timeout=deadline - loop.time())
+                except asyncio.TimeoutError:
+                    yield bytes(buffer)
+                    buffer.clear()
+                    deadline = None
+                    continue
+
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+
+            chunk = item if isinstance(item, bytes) else str(item).encode()
+            buffer += chunk
+            if len(buffer) >= max_bytes or chunk.startswith(_FLUSH_NOW_PREFIXES):
+                yield bytes(buffer)
+                buffer.clear()
+                deadline = None
+            elif deadline is None:
+                deadline = loop.time() + max_s
+
+        if buffer:
+            yield bytes(buffer)
+    finally:
+        pump_task.cancel()
+
+
+# Constant-shape frames, encoded once at import instead of per stream
+_DONE_FRAME = b'data: [DONE]\n\n'
+_COMPLETED_FRAMES = {
+    (is_error, is_cancelled): sse_event(
+        {'type': 'stream.completed', 'is_error': is_error, 'is_cancelled': is_cancelled}
+    )
+    for is_error in (False, True)
+    for is_cancelled in (False, True)
+}
 
 
 class InvokeAgentRequest(BaseModel):
@@ -114,7 +208,7 @@ async def invoke_agent(request: Request, body: InvokeAgentRequest):
         if len(body.message) > 40:
             temp_title = temp_title.rsplit(' ', 1)[0] + '...'
         conversation = await conv_storage.create(title=temp_title)
-        conversation_id = conversation.id
+        conversation_id = str(conversation.id)
         logger.info(f'Created new conversation: {conversation_id}')
 
         # Generate AI title in the background (fire-and-forget)
@@ -152,7 +246,9 @@ async def invoke_agent(request: Request, body: InvokeAgentRequest):
     # Create the agent coroutine that will run in background
     async def run_agent():
         """Run the agent and accumulate events in the stream."""
-        final_text = ''
+        # Collect chunks and join once; repeated str += on a nonlocal is O(N^2)
+        # over a long response
+        final_text_parts: list[str] = []
         new_session_id: Optional[str] = None
         error_message: Optional[str] = None
         received_deltas = False  # Track if we received streaming deltas
@@ -185,7 +281,7 @@ async def invoke_agent(request: Request, body: InvokeAgentRequest):
                 if event_type == 'text_delta':
                     # Token-by-token streaming - this is preferred
                     text = event.get('text', '')
-                    final_text += text
+                    final_text_parts.append(text)
                     received_deltas = True
                     stream.add_event({'type': 'text_delta', 'text': text})
 
@@ -198,7 +294,7 @@ async def invoke_agent(request: Request, body: InvokeAgentRequest):
                     if text:
                         if not received_deltas:
                             # No deltas received, so send complete text blocks to client
-                            final_text += text
+                            final_text_parts.append(text)
                             stream.add_event({'type': 'text', 'text': text})
                         # Note: If received_deltas is True, we skip sending 'text' events
                         # because the client already received the same content via 'text_delta'
@@ -304,51 +400,37 @@ async def invoke_agent(request: Request, body: InvokeAgentRequest):
 
             stream.add_event({'type': 'error', 'error': error_message})
 
+        final_text = ''.join(final_text_parts)
+
         # Save messages to storage after stream completes (if not cancelled)
         if not stream.is_cancelled:
             try:
-                # Save user message
-                await conv_storage.add_message(
-                    conversation_id=conversation_id,
-                    role='user',
-                    content=body.message,
-                )
-
-                # Save assistant response (or error)
+                # Assistant response (or error) to persist alongside the user message
+                assistant_content: Optional[str] = None
+                is_error = False
                 if final_text or error_message:
-                    content = final_text if final_text else f'Error: {error_message}'
+                    assistant_content = final_text if final_text else f'Error: {error_message}'
                     is_error = bool(error_message and not final_text)
-                    logger.info(f'Saving assistant message: {len(content)} chars, is_error={is_error}')
-                    await conv_storage.add_message(
-                        conversation_id=conversation_id,
-                        role='assistant',
-                        content=content,
-                        is_error=is_error,
+                    logger.info(
+                        f'Saving assistant message: {len(assistant_content)} chars, is_error={is_error}'
                     )
                 else:
                     logger.warning('No response to save (no text and no error)')
 
-                # Update session_id for conversation resumption
-                if new_session_id:
-                    await conv_storage.update_session_id(conversation_id, new_session_id)
-
-                # Update cluster_id if provided
-                if body.cluster_id:
-                    await conv_storage.update_cluster_id(conversation_id, body.cluster_id)
-
-                # Update catalog/schema if provided
-                if body.default_catalog or body.default_schema:
-                    await conv_storage.update_catalog_schema(
-                        conversation_id, body.default_catalog, body.default_schema
-                    )
-
-                # Update warehouse_id if provided
-                if body.warehouse_id:
-                    await conv_storage.update_warehouse_id(conversation_id, body.warehouse_id)
-
-                # Update workspace_folder if provided
-                if body.workspace_folder:
-                    await conv_storage.update_workspace_folder(conversation_id, body.workspace_folder)
+                # Both messages plus session/cluster/catalog/warehouse/folder
+                # updates land in a single transaction instead of one commit each
+                await conv_storage.finalize_turn(
+                    conversation_id=conversation_id,
+                    user_content=body.message,
+                    assistant_content=assistant_content,
+                    assistant_is_error=is_error,
+                    session_id=new_session_id,
+                    cluster_id=body.cluster_id,
+                    default_catalog=body.default_catalog,
+                    default_schema=body.default_schema,
+                    warehouse_id=body.warehouse_id,
+                    workspace_folder=body.workspace_folder,
+                )
 
                 logger.info(
                     f'Saved messages to conversation {conversation_id}: '
@@ -420,12 +502,8 @@ async def stream_progress(execution_id: str, body: StreamProgressRequest):
 
             # Check if stream is complete or cancelled
             if stream.is_complete or stream.is_cancelled:
-                yield sse_event({
-                    'type': 'stream.completed',
-                    'is_error': stream.error is not None,
-                    'is_cancelled': stream.is_cancelled,
-                })
-                yield 'data: [DONE]\n\n'
+                yield _COMPLETED_FRAMES[stream.error is not None, stream.is_cancelled]
+                yield _DONE_FRAME
                 break
 
             # Check if we've exceeded the SSE window (50 seconds)
@@ -443,15 +521,10 @@ async def stream_progress(execution_id: str, body: StreamProgressRequest):
             # Wait a bit before checking for new events
             await asyncio.sleep(0.1)
 
-    return StreamingResponse(
-        generate_events(),
-        media_type='text/event-stream',
-        headers={
-            'Cache-Control': 'no-cache',
-            'Connection': 'keep-alive',
-            'X-Accel-Buffering': 'no',
-        },
-    )
+    # EventSourceResponse sets the SSE headers (Cache-Control, X-Accel-Buffering)
+    # itself, passes our pre-framed bytes through untouched, and emits ping
+    # comments so proxies don't drop the connection during long tool runs.
+    return EventSourceResponse(_coalesce(generate_events()), ping=15)
 
 
 @router.post('/stop_stream/{execution_id}', response_model=StopStreamResponse)
@@ -487,7 +560,39 @@ async def stop_stream(execution_id: str):
     )
 
 
-@router.get('/projects/{project_id}/files')
+def _walk_project_dir(project_dir: Path) -> list[dict]:
+    """Walk a project directory with a single stat() per file.
+
+    os.scandir serves is_dir/is_file from the directory entry itself (no
+    syscall on Linux) and caches the stat result, so each file costs one
+    stat instead of the two Path.stat() calls a pathlib walk would make.
+    """
+    base = str(project_dir)
+    files: list[dict] = []
+    stack = [base]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    st = entry.stat(follow_symlinks=False)
+                    files.append(
+                        {
+                            'path': os.path.relpath(entry.path, base),
+                            'name': entry.name,
+                            'size': st.st_size,
+                            # time.strftime over localtime is several times cheaper
+                            # than building a datetime and calling isoformat per file
+                            'modified': time.strftime(
+                                '%Y-%m-%dT%H:%M:%S', time.localtime(st.st_mtime)
+                            ),
+                        }
+                    )
+    return files
+
+
+@router.get('/projects/{project_id}/files', response_class=ORJSONResponse)
 async def list_project_files(request: Request, project_id: str):
     """List files in a project directory."""
     user_email = await get_current_user(request)
@@ -498,21 +603,10 @@ async def list_project_files(request: Request, project_id: str):
     if not project:
         raise HTTPException(status_code=404, detail=f'Project {project_id} not found')
 
-    # Get project directory and list files
+    # Get project directory and list files; the walk is synchronous disk I/O,
+    # so run it in the threadpool instead of stalling the event loop
     project_dir = get_project_directory(project_id)
-
-    files = []
-    for path in project_dir.rglob('*'):
-        if path.is_file():
-            rel_path = path.relative_to(project_dir)
-            files.append(
-                {
-                    'path': str(rel_path),
-                    'name': path.name,
-                    'size': path.stat().st_size,
-                    'modified': datetime.fromtimestamp(path.stat().st_mtime).isoformat(),
-                }
-            )
+    files = await run_in_threadpool(_walk_project_dir, project_dir)
 
     return {'project_id': project_id, 'files': files}
 
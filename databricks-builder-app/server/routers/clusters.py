@@ -3,6 +3,7 @@
 import logging
 
 from fastapi import APIRouter, Request
+from fastapi.responses import ORJSONResponse
 from databricks_tools_core.auth import set_databricks_auth, clear_databricks_auth
 
 from ..services.clusters import list_clusters_async
@@ -12,7 +13,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.get('/clusters')
+@router.get('/clusters', response_class=ORJSONResponse)
 async def get_clusters(request: Request):
   """Get available Databricks clusters.
 
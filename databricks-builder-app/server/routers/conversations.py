@@ -6,6 +6,7 @@ All endpoints are scoped to the current authenticated user and project.
 import logging
 
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from ..services.storage import ConversationStorage
@@ -37,7 +38,9 @@ async def get_all_conversations(request: Request, project_id: str):
   conversations = await storage.get_all()
   logger.info(f'Retrieved {len(conversations)} conversations for project {project_id}')
 
-  return [conv.to_dict_summary() for conv in conversations]
+  # Return a Response directly so FastAPI skips the jsonable_encoder walk;
+  # to_dict_summary already yields JSON-native values
+  return ORJSONResponse([conv.to_dict_summary() for conv in conversations])
 
 
 @router.get('/projects/{project_id}/conversations/{conversation_id}')
@@ -56,7 +59,7 @@ async def get_conversation(request: Request, project_id: str, conversation_id: s
   logger.info(
     f'Retrieved conversation {conversation_id} with {len(conversation.messages)} messages'
   )
-  return conversation.to_dict()
+  return ORJSONResponse(conversation.to_dict())
 
 
 @router.post('/projects/{project_id}/conversations')
@@ -70,7 +73,7 @@ async def create_conversation(request: Request, project_id: str, body: CreateCon
   try:
     conversation = await storage.create(title=body.title)
     logger.info(f'Created conversation {conversation.id} in project {project_id}')
-    return conversation.to_dict()
+    return ORJSONResponse(conversation.to_dict())
   except ValueError as e:
     logger.warning(f'Failed to create conversation: {e}')
     raise HTTPException(status_code=404, detail=str(e))
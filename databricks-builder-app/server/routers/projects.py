@@ -6,6 +6,7 @@ All endpoints are scoped to the current authenticated user.
 import logging
 
 from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 
 from ..services.storage import ProjectStorage
@@ -37,7 +38,9 @@ async def get_all_projects(request: Request):
   projects = await storage.get_all()
   logger.info(f'Retrieved {len(projects)} projects for user: {user_email}')
 
-  return [project.to_dict() for project in projects]
+  # Return a Response directly so FastAPI skips the jsonable_encoder walk;
+  # to_dict already yields JSON-native values (ids and datetimes are strings)
+  return ORJSONResponse([project.to_dict() for project in projects])
 
 
 @router.get('/projects/{project_id}')
@@ -53,7 +56,7 @@ async def get_project(request: Request, project_id: str):
     logger.warning(f'Project not found: {project_id} for user: {user_email}')
     raise HTTPException(status_code=404, detail=f'Project {project_id} not found')
 
-  return project.to_dict()
+  return ORJSONResponse(project.to_dict())
 
 
 @router.post('/projects')
@@ -67,7 +70,7 @@ async def create_project(request: Request, body: CreateProjectRequest):
   project = await storage.create(name=body.name)
   logger.info(f'Created project {project.id} for user: {user_email}')
 
-  return project.to_dict()
+  return ORJSONResponse(project.to_dict())
 
 
 @router.patch('/projects/{project_id}')
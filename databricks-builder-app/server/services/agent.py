@@ -17,6 +17,7 @@ See: https://github.com/anthropics/claude-agent-sdk-python/issues/462
 """
 
 import asyncio
+import functools
 import json
 import logging
 import os
@@ -50,14 +51,28 @@ from .system_prompt import get_system_prompt
 logger = logging.getLogger(__name__)
 
 # Built-in Claude Code tools
-BUILTIN_TOOLS = [
+BUILTIN_TOOLS = (
   'Read',
   'Write',
   'Edit',
 #  'Bash',
   'Glob',
   'Grep',
-]
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _merged_allowed_tools(databricks_tools: tuple[str, ...], include_skill: bool) -> tuple[str, ...]:
+  """Merge built-in and Databricks tool names into one shared tuple.
+
+  The MCP tool set only changes when skills config changes, so the merged
+  tuple is cached and handed to ClaudeAgentOptions by reference instead of
+  copy+extend per request.
+  """
+  merged = BUILTIN_TOOLS + databricks_tools
+  if include_skill:
+    merged += ('Skill',)
+  return merged
 
 # Cached Databricks tools (loaded once)
 _databricks_server = None
@@ -299,6 +314,146 @@ def _run_agent_in_fresh_loop(message, options, result_queue, context, is_cancell
   context.run(run_with_context)
 
 
+def _text_event(block) -> dict:
+  return {'type': 'text', 'text': block.text}
+
+
+def _thinking_event(block) -> dict:
+  return {'type': 'thinking', 'thinking': block.thinking}
+
+
+def _tool_use_event(block) -> dict:
+  return {
+    'type': 'tool_use',
+    'tool_id': block.id,
+    'tool_name': block.name,
+    'tool_input': block.input,
+  }
+
+
+def _tool_result_event(block) -> dict:
+  """Normalize a ToolResultBlock into a tool_result event dict.
+
+  Content may be a string, a list of content blocks, or something else
+  entirely; flatten it to a single string for the frontend.
+  """
+  content = block.content
+  if isinstance(content, list):
+    # Handle list of content blocks (e.g., [{'type': 'text', 'text': '...'}])
+    texts = []
+    for item in content:
+      if isinstance(item, dict) and 'text' in item:
+        texts.append(item['text'])
+      elif isinstance(item, str):
+        texts.append(item)
+      else:
+        texts.append(str(item))
+    content = '\n'.join(texts) if texts else str(block.content)
+  elif not isinstance(content, str):
+    content = str(content)
+
+  # Improve generic "Stream closed" error messages
+  if block.is_error and 'Stream closed' in content:
+    content = f'Tool execution interrupted: {content}. This may occur when operations exceed timeout limits or when the connection is interrupted. Check backend logs for more details.'
+    logger.warning(f'Tool result error (improved): {content}')
+
+  return {
+    'type': 'tool_result',
+    'tool_use_id': block.tool_use_id,
+    'content': content,
+    'is_error': block.is_error,
+  }
+
+
+# Exact-type dispatch for content blocks: one dict lookup per block instead of
+# walking an isinstance chain in the hottest loop of the stream.
+_BLOCK_HANDLERS = {
+  TextBlock: _text_event,
+  ThinkingBlock: _thinking_event,
+  ToolUseBlock: _tool_use_event,
+  ToolResultBlock: _tool_result_event,
+}
+
+
+def _handle_assistant(msg):
+  for block in msg.content:
+    handler = _BLOCK_HANDLERS.get(type(block))
+    if handler:
+      yield handler(block)
+
+
+def _handle_result(msg):
+  yield {
+    'type': 'result',
+    'session_id': msg.session_id,
+    'duration_ms': msg.duration_ms,
+    'total_cost_usd': msg.total_cost_usd,
+    'is_error': msg.is_error,
+    'num_turns': msg.num_turns,
+  }
+
+
+def _handle_system(msg):
+  # getattr with a default is a plain lookup; hasattr pays for an exception
+  # setup on every init/tool-status event
+  yield {
+    'type': 'system',
+    'subtype': msg.subtype,
+    'data': getattr(msg, 'data', None),
+  }
+
+
+def _handle_user(msg):
+  # UserMessage can contain tool results (sent back to Claude after tool execution);
+  # string content is just an echo of user input and is skipped.
+  msg_content = msg.content
+  if isinstance(msg_content, list):
+    for block in msg_content:
+      if type(block) is ToolResultBlock:
+        yield _tool_result_event(block)
+
+
+def _handle_stream_event(msg):
+  """Handle streaming events for token-by-token updates."""
+  event_data = msg.event
+  event_type = event_data.get('type', '')
+
+  # Handle text delta events (token streaming)
+  if event_type == 'content_block_delta':
+    delta = event_data.get('delta', {})
+    delta_type = delta.get('type', '')
+    if delta_type == 'text_delta':
+      text = delta.get('text', '')
+      if text:
+        yield {
+          'type': 'text_delta',
+          'text': text,
+        }
+    elif delta_type == 'thinking_delta':
+      thinking = delta.get('thinking', '')
+      if thinking:
+        yield {
+          'type': 'thinking_delta',
+          'thinking': thinking,
+        }
+  # Pass through other stream events if needed
+  elif event_type not in ('content_block_start', 'content_block_stop', 'message_start', 'message_delta', 'message_stop'):
+    yield {
+      'type': 'stream_event',
+      'event': event_data,
+      'session_id': msg.session_id,
+    }
+
+
+_MSG_HANDLERS = {
+  AssistantMessage: _handle_assistant,
+  ResultMessage: _handle_result,
+  SystemMessage: _handle_system,
+  UserMessage: _handle_user,
+  StreamEvent: _handle_stream_event,
+}
+
+
 async def stream_agent_response(
   project_id: str,
   message: str,
@@ -351,9 +506,6 @@ async def stream_agent_response(
   set_databricks_auth(databricks_host, databricks_token)
 
   try:
-    # Build allowed tools list
-    allowed_tools = BUILTIN_TOOLS.copy()
-
     # Sync project skills directory before running agent
     from .skills_manager import sync_project_skills, get_available_skills, get_allowed_mcp_tools
     sync_project_skills(project_dir, enabled_skills=enabled_skills)
@@ -372,12 +524,9 @@ async def stream_agent_response(
     else:
       logger.info(f'Databricks MCP server configured with {len(filtered_tool_names)} tools')
 
-    allowed_tools.extend(filtered_tool_names)
-
-    # Only add the Skill tool if there are enabled skills for the agent to use
+    # Only include the Skill tool if there are enabled skills for the agent to use
     available = get_available_skills(enabled_skills=enabled_skills)
-    if available:
-      allowed_tools.append('Skill')
+    allowed_tools = _merged_allowed_tools(tuple(filtered_tool_names), bool(available))
 
     # Generate system prompt with available skills, cluster, warehouse, and catalog/schema context
     system_prompt = get_system_prompt(
@@ -499,137 +648,11 @@ async def stream_agent_response(
       elif msg_type == 'error':
         raise msg
       elif msg_type == 'message':
-        # Handle different message types
-        if isinstance(msg, AssistantMessage):
-          # Process content blocks
-          for block in msg.content:
-            if isinstance(block, TextBlock):
-              yield {
-                'type': 'text',
-                'text': block.text,
-              }
-            elif isinstance(block, ThinkingBlock):
-              yield {
-                'type': 'thinking',
-                'thinking': block.thinking,
-              }
-            elif isinstance(block, ToolUseBlock):
-              yield {
-                'type': 'tool_use',
-                'tool_id': block.id,
-                'tool_name': block.name,
-                'tool_input': block.input,
-              }
-            elif isinstance(block, ToolResultBlock):
-              # Extract content - may be string, list, or complex structure
-              content = block.content
-              if isinstance(content, list):
-                # Handle list of content blocks (e.g., [{'type': 'text', 'text': '...'}])
-                texts = []
-                for item in content:
-                  if isinstance(item, dict) and 'text' in item:
-                    texts.append(item['text'])
-                  elif isinstance(item, str):
-                    texts.append(item)
-                  else:
-                    texts.append(str(item))
-                content = '\n'.join(texts) if texts else str(block.content)
-              elif not isinstance(content, str):
-                content = str(content)
-
-              # Improve generic "Stream closed" error messages
-              if block.is_error and 'Stream closed' in content:
-                content = f'Tool execution interrupted: {content}. This may occur when operations exceed timeout limits or when the connection is interrupted. Check backend logs for more details.'
-                logger.warning(f'Tool result error (improved): {content}')
-
-              yield {
-                'type': 'tool_result',
-                'tool_use_id': block.tool_use_id,
-                'content': content,
-                'is_error': block.is_error,
-              }
-
-        elif isinstance(msg, ResultMessage):
-          yield {
-            'type': 'result',
-            'session_id': msg.session_id,
-            'duration_ms': msg.duration_ms,
-            'total_cost_usd': msg.total_cost_usd,
-            'is_error': msg.is_error,
-            'num_turns': msg.num_turns,
-          }
-
-        elif isinstance(msg, SystemMessage):
-          yield {
-            'type': 'system',
-            'subtype': msg.subtype,
-            'data': msg.data if hasattr(msg, 'data') else None,
-          }
-
-        elif isinstance(msg, UserMessage):
-          # UserMessage can contain tool results (sent back to Claude after tool execution)
-          msg_content = msg.content
-          if isinstance(msg_content, list):
-            for block in msg_content:
-              if isinstance(block, ToolResultBlock):
-                # Extract content - may be string, list, or complex structure
-                content = block.content
-                if isinstance(content, list):
-                  texts = []
-                  for item in content:
-                    if isinstance(item, dict) and 'text' in item:
-                      texts.append(item['text'])
-                    elif isinstance(item, str):
-                      texts.append(item)
-                    else:
-                      texts.append(str(item))
-                  content = '\n'.join(texts) if texts else str(block.content)
-                elif not isinstance(content, str):
-                  content = str(content)
-
-                # Improve generic "Stream closed" error messages
-                if block.is_error and 'Stream closed' in content:
-                  content = f'Tool execution interrupted: {content}. This may occur when operations exceed timeout limits or when the connection is interrupted. Check backend logs for more details.'
-                  logger.warning(f'Tool result error (improved): {content}')
-
-                yield {
-                  'type': 'tool_result',
-                  'tool_use_id': block.tool_use_id,
-                  'content': content,
-                  'is_error': block.is_error,
-                }
-          # Skip string content (just echo of user input)
-
-        elif isinstance(msg, StreamEvent):
-          # Handle streaming events for token-by-token updates
-          event_data = msg.event
-          event_type = event_data.get('type', '')
-
-          # Handle text delta events (token streaming)
-          if event_type == 'content_block_delta':
-            delta = event_data.get('delta', {})
-            delta_type = delta.get('type', '')
-            if delta_type == 'text_delta':
-              text = delta.get('text', '')
-              if text:
-                yield {
-                  'type': 'text_delta',
-                  'text': text,
-                }
-            elif delta_type == 'thinking_delta':
-              thinking = delta.get('thinking', '')
-              if thinking:
-                yield {
-                  'type': 'thinking_delta',
-                  'thinking': thinking,
-                }
-          # Pass through other stream events if needed
-          elif event_type not in ('content_block_start', 'content_block_stop', 'message_start', 'message_delta', 'message_stop'):
-            yield {
-              'type': 'stream_event',
-              'event': event_data,
-              'session_id': msg.session_id,
-            }
+        # O(1) exact-type dispatch instead of an isinstance chain per message
+        handler = _MSG_HANDLERS.get(type(msg))
+        if handler:
+          for event in handler(msg):
+            yield event
 
   except Exception as e:
     # Log full traceback for debugging
@@ -12,7 +12,7 @@ from io import BytesIO
 from pathlib import Path
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.dialects.postgresql import insert
 
 from ..db.database import session_scope
@@ -59,11 +59,13 @@ async def create_backup(project_id: str) -> bool:
     logger.warning(f'Project directory does not exist: {project_dir}')
     return False
 
-  # Create zip in memory
+  # Create zip in memory. The archive is stored uncompressed: compression
+  # happens at the column level (BloscBlob), which is far faster than
+  # DEFLATE and compresses the raw bytes better than re-compressing a zip.
   buffer = BytesIO()
   file_count = 0
 
-  with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+  with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_STORED) as zf:
     for file_path in project_dir.rglob('*'):
       if file_path.is_file():
         arcname = str(file_path.relative_to(project_dir))
@@ -84,7 +86,7 @@ async def create_backup(project_id: str) -> bool:
     )
     stmt = stmt.on_conflict_do_update(
       index_elements=['project_id'],
-      set_={'backup_data': backup_data, 'updated_at': ProjectBackup.updated_at.default.arg()},
+      set_={'backup_data': backup_data, 'updated_at': func.now()},
     )
     await session.execute(stmt)
 
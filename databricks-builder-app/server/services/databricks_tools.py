@@ -53,6 +53,10 @@ def load_databricks_tools():
 _all_sdk_tools = None
 _all_tool_names = None
 
+# Filtered servers keyed by allowed-tool set. The SDK tool objects are shared
+# with the full server, so one server per unique skill selection is safe to reuse.
+_filtered_server_cache: dict[frozenset[str], tuple[Any, list[str]]] = {}
+
 
 def _get_all_sdk_tools():
     """Load and cache all SDK tool wrappers.
@@ -103,6 +107,12 @@ def create_filtered_databricks_server(allowed_tool_names: list[str]):
     Returns:
         Tuple of (server_config, filtered_tool_names)
     """
+    cache_key = frozenset(allowed_tool_names)
+    cached = _filtered_server_cache.get(cache_key)
+    if cached is not None:
+        server, filtered_names = cached
+        return server, list(filtered_names)
+
     all_sdk_tools, all_tool_names = _get_all_sdk_tools()
 
     allowed_set = set(allowed_tool_names)
@@ -120,7 +130,8 @@ def create_filtered_databricks_server(allowed_tool_names: list[str]):
     )
 
     server = create_sdk_mcp_server(name='databricks', tools=filtered_tools)
-    return server, filtered_names
+    _filtered_server_cache[cache_key] = (server, filtered_names)
+    return server, list(filtered_names)
 
 
 def _create_check_operation_status_tool():
@@ -4,6 +4,7 @@ Provides user-scoped CRUD operations using async SQLAlchemy.
 """
 
 import json
+import uuid
 from typing import Optional
 
 from sqlalchemy import delete, func, select, update
@@ -12,6 +13,22 @@ from sqlalchemy.orm import selectinload
 from server.db import Conversation, Execution, Message, Project, session_scope
 
 
+def _coerce_uuid(value) -> Optional[uuid.UUID]:
+  """Parse an externally supplied ID into a UUID, or None if malformed.
+
+  Path parameters arrive as raw strings; binding a non-UUID string against
+  a Uuid column errors at the driver ('invalid input syntax for type uuid')
+  and surfaces as a 500. Mapping malformed IDs to None here lets them fall
+  through as a plain not-found instead.
+  """
+  if isinstance(value, uuid.UUID):
+    return value
+  try:
+    return uuid.UUID(value)
+  except (AttributeError, TypeError, ValueError):
+    return None
+
+
 class ProjectStorage:
   """User-scoped project storage operations."""
 
@@ -31,6 +48,9 @@ class ProjectStorage:
 
   async def get(self, project_id: str) -> Optional[Project]:
     """Get a specific project with conversations."""
+    project_id = _coerce_uuid(project_id)
+    if project_id is None:
+      return None
     async with session_scope() as session:
       result = await session.execute(
         select(Project)
@@ -51,7 +71,7 @@ class ProjectStorage:
       )
       session.add(project)
       await session.flush()
-      await session.refresh(project, ['id', 'name', 'user_email', 'created_at'])
+      await session.refresh(project, ['id', 'name', 'user_email', 'created_at', 'conversation_count'])
       # Initialize conversations as empty list for to_dict()
       # (don't use ORM attribute assignment which triggers lazy load)
       project.__dict__['conversations'] = []
@@ -59,6 +79,9 @@ class ProjectStorage:
 
   async def update_name(self, project_id: str, name: str) -> bool:
     """Update project name."""
+    project_id = _coerce_uuid(project_id)
+    if project_id is None:
+      return False
     async with session_scope() as session:
       result = await session.execute(
         select(Project).where(
@@ -74,6 +97,9 @@ class ProjectStorage:
 
   async def delete(self, project_id: str) -> bool:
     """Delete a project and all its conversations."""
+    project_id = _coerce_uuid(project_id)
+    if project_id is None:
+      return False
     async with session_scope() as session:
       result = await session.execute(
         delete(Project).where(
@@ -89,7 +115,7 @@ class ConversationStorage:
 
   def __init__(self, user_email: str, project_id: str):
     self.user_email = user_email
-    self.project_id = project_id
+    self.project_id = _coerce_uuid(project_id)
 
   async def get_all(self) -> list[Conversation]:
     """Get all conversations for the project, newest first."""
@@ -108,6 +134,9 @@ class ConversationStorage:
 
   async def get(self, conversation_id: str) -> Optional[Conversation]:
     """Get a specific conversation with messages."""
+    conversation_id = _coerce_uuid(conversation_id)
+    if conversation_id is None:
+      return None
     async with session_scope() as session:
       result = await session.execute(
         select(Conversation)
@@ -140,7 +169,9 @@ class ConversationStorage:
       )
       session.add(conversation)
       await session.flush()
-      await session.refresh(conversation, ['id', 'project_id', 'title', 'created_at', 'session_id'])
+      await session.refresh(
+        conversation, ['id', 'project_id', 'title', 'created_at', 'session_id', 'message_count']
+      )
       # Initialize messages as empty list for to_dict()
       # (don't use ORM attribute assignment which triggers lazy load)
       conversation.__dict__['messages'] = []
@@ -148,6 +179,9 @@ class ConversationStorage:
 
   async def update_title(self, conversation_id: str, title: str) -> bool:
     """Update conversation title."""
+    conversation_id = _coerce_uuid(conversation_id)
+    if conversation_id is None:
+      return False
     async with session_scope() as session:
       result = await session.execute(
         select(Conversation)
@@ -166,6 +200,9 @@ class ConversationStorage:
 
   async def update_session_id(self, conversation_id: str, session_id: str) -> bool:
     """Update Claude agent session ID for resuming conversations."""
+    conversation_id = _coerce_uuid(conversation_id)
+    if conversation_id is None:
+      return False
     async with session_scope() as session:
       result = await session.execute(
         select(Conversation)
@@ -184,6 +221,9 @@ class ConversationStorage:
 
   async def update_cluster_id(self, conversation_id: str, cluster_id: str | None) -> bool:
     """Update Databricks cluster ID for code execution."""
+    conversation_id = _coerce_uuid(conversation_id)
+    if conversation_id is None:
+      return False
     async with session_scope() as session:
       result = await session.execute(
         select(Conversation)
@@ -207,6 +247,9 @@ class ConversationStorage:
     default_schema: str | None,
   ) -> bool:
     """Update default Unity Catalog context for the conversation."""
+    conversation_id = _coerce_uuid(conversation_id)
+    if conversation_id is None:
+      return False
     async with session_scope() as session:
       result = await session.execute(
         select(Conversation)
@@ -226,6 +269,9 @@ class ConversationStorage:
 
   async def update_warehouse_id(self, conversation_id: str, warehouse_id: str | None) -> bool:
     """Update Databricks SQL warehouse ID for SQL queries."""
+    conversation_id = _coerce_uuid(conversation_id)
+    if conversation_id is None:
+      return False
     async with session_scope() as session:
       result = await session.execute(
         select(Conversation)
@@ -244,6 +290,9 @@ class ConversationStorage:
 
   async def update_workspace_folder(self, conversation_id: str, workspace_folder: str | None) -> bool:
     """Update workspace folder for uploading files."""
+    conversation_id = _coerce_uuid(conversation_id)
+    if conversation_id is None:
+      return False
     async with session_scope() as session:
       result = await session.execute(
         select(Conversation)
@@ -262,6 +311,9 @@ class ConversationStorage:
 
   async def delete(self, conversation_id: str) -> bool:
     """Delete a conversation and all its messages."""
+    conversation_id = _coerce_uuid(conversation_id)
+    if conversation_id is None:
+      return False
     async with session_scope() as session:
       # First verify ownership via join, then delete
       result = await session.execute(
@@ -292,6 +344,9 @@ class ConversationStorage:
 
     Also auto-generates conversation title from first user message.
     """
+    conversation_id = _coerce_uuid(conversation_id)
+    if conversation_id is None:
+      return None
     async with session_scope() as session:
       # Verify conversation exists and user owns the project
       result = await session.execute(
@@ -333,17 +388,92 @@ class ConversationStorage:
       await session.refresh(message)
       return message
 
+  async def finalize_turn(
+    self,
+    conversation_id: str,
+    user_content: str,
+    assistant_content: Optional[str] = None,
+    assistant_is_error: bool = False,
+    session_id: Optional[str] = None,
+    cluster_id: Optional[str] = None,
+    default_catalog: Optional[str] = None,
+    default_schema: Optional[str] = None,
+    warehouse_id: Optional[str] = None,
+    workspace_folder: Optional[str] = None,
+  ) -> bool:
+    """Persist a completed agent turn in a single transaction.
+
+    Inserts the user/assistant messages with add_all and applies any
+    conversation metadata updates (session, cluster, catalog/schema,
+    warehouse, workspace folder) in the same commit, instead of one
+    round-trip and fsync per field.
+    """
+    conversation_id = _coerce_uuid(conversation_id)
+    if conversation_id is None:
+      return False
+    async with session_scope() as session:
+      result = await session.execute(
+        select(Conversation)
+        .join(Project, Conversation.project_id == Project.id)
+        .options(selectinload(Conversation.messages))
+        .where(
+          Conversation.id == conversation_id,
+          Conversation.project_id == self.project_id,
+          Project.user_email == self.user_email,
+        )
+      )
+      conversation = result.scalar_one_or_none()
+      if not conversation:
+        return False
+
+      messages = [Message(conversation_id=conversation_id, role='user', content=user_content)]
+      if assistant_content is not None:
+        messages.append(
+          Message(
+            conversation_id=conversation_id,
+            role='assistant',
+            content=assistant_content,
+            is_error=assistant_is_error,
+          )
+        )
+
+      # Auto-generate title from first user message (same rule as add_message)
+      if conversation.title == 'New Conversation' and len(conversation.messages) == 0:
+        new_title = user_content[:50].strip()
+        if len(user_content) > 50:
+          new_title += '...'
+        conversation.title = new_title
+
+      if session_id is not None:
+        conversation.session_id = session_id
+      if cluster_id is not None:
+        conversation.cluster_id = cluster_id
+      if default_catalog is not None:
+        conversation.default_catalog = default_catalog
+      if default_schema is not None:
+        conversation.default_schema = default_schema
+      if warehouse_id is not None:
+        conversation.warehouse_id = warehouse_id
+      if workspace_folder is not None:
+        conversation.workspace_folder = workspace_folder
+
+      session.add_all(messages)
+      return True
+
 
 class ExecutionStorage:
   """Execution state storage for session independence."""
 
   def __init__(self, user_email: str, project_id: str, conversation_id: str):
     self.user_email = user_email
-    self.project_id = project_id
-    self.conversation_id = conversation_id
+    self.project_id = _coerce_uuid(project_id)
+    self.conversation_id = _coerce_uuid(conversation_id)
 
   async def create(self, execution_id: str) -> Execution:
     """Create a new execution record."""
+    execution_id = _coerce_uuid(execution_id)
+    if execution_id is None:
+      raise ValueError('Invalid execution ID')
     async with session_scope() as session:
       # Verify conversation ownership via join
       result = await session.execute(
@@ -372,6 +502,9 @@ class ExecutionStorage:
 
   async def get(self, execution_id: str) -> Optional[Execution]:
     """Get an execution by ID."""
+    execution_id = _coerce_uuid(execution_id)
+    if execution_id is None:
+      return None
     async with session_scope() as session:
       result = await session.execute(
         select(Execution)
@@ -420,6 +553,9 @@ class ExecutionStorage:
 
   async def add_events(self, execution_id: str, events: list[dict]) -> bool:
     """Append events to an execution's event list."""
+    execution_id = _coerce_uuid(execution_id)
+    if execution_id is None:
+      return False
     async with session_scope() as session:
       result = await session.execute(
         select(Execution)
@@ -447,6 +583,9 @@ class ExecutionStorage:
     error: Optional[str] = None,
   ) -> bool:
     """Update execution status."""
+    execution_id = _coerce_uuid(execution_id)
+    if execution_id is None:
+      return False
     async with session_scope() as session:
       result = await session.execute(
         select(Execution)
@@ -5,12 +5,20 @@ A FastMCP server that exposes Databricks operations as MCP tools.
 Simply wraps functions from databricks-tools-core.
 """
 
+import orjson
 from fastmcp import FastMCP
 
 from .middleware import TimeoutHandlingMiddleware
 
+
+def _serialize_tool_result(value) -> str:
+    """Serialize tool results with orjson — several times faster than stdlib
+    json on large payloads like get_pipeline_events with high max_results."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC).decode()
+
+
 # Create the server
-mcp = FastMCP("Databricks MCP Server")
+mcp = FastMCP("Databricks MCP Server", tool_serializer=_serialize_tool_result)
 
 # Register middleware (see middleware.py for details on each)
 mcp.add_middleware(TimeoutHandlingMiddleware())
@@ -0,0 +1,40 @@
+"""Shared serialization helpers for SDK response objects."""
+
+import dataclasses
+import functools
+import operator
+from typing import Any, Callable, Dict, List
+
+_as_dict_method = operator.methodcaller("as_dict")
+
+
+def _copy_vars(obj: Any) -> Dict[str, Any]:
+    # Copy: vars() aliases the object's __dict__, so handing it to the MCP
+    # framework would let downstream mutation corrupt the SDK object
+    return dict(vars(obj))
+
+
+@functools.lru_cache(maxsize=None)
+def _converter_for(cls: type) -> Callable[[Any], Dict[str, Any]]:
+    """Resolve how to dict-ify instances of cls (decided once per type)."""
+    if hasattr(cls, "as_dict"):
+        return _as_dict_method
+    if dataclasses.is_dataclass(cls):
+        return dataclasses.asdict
+    return _copy_vars
+
+
+def to_dict(obj: Any) -> Dict[str, Any]:
+    """Convert one SDK response object to a plain dict."""
+    return _converter_for(type(obj))(obj)
+
+
+def to_dict_list(objs: List[Any]) -> List[Dict[str, Any]]:
+    """Convert a homogeneous list of SDK objects to plain dicts.
+
+    Resolves the converter once from the first element's type instead of
+    probing every element.
+    """
+    if not objs:
+        return []
+    return list(map(_converter_for(type(objs[0])), objs))
@@ -8,6 +8,7 @@ from databricks_tools_core.compute import (
     start_cluster as _start_cluster,
     get_cluster_status as _get_cluster_status,
     execute_databricks_command as _execute_databricks_command,
+    get_command_status as _get_command_status,
     run_python_file_on_databricks as _run_python_file_on_databricks,
     NoRunningClusterError,
 )
@@ -105,12 +106,24 @@ def execute_databricks_command(
     language: str = "python",
     timeout: int = 120,
     destroy_context_on_completion: bool = False,
+    initial_interval: float = 0.25,
+    max_interval: float = 5.0,
+    wait: bool = True,
+    reuse_context: bool = True,
 ) -> Dict[str, Any]:
     """
     Execute code on a Databricks cluster.
 
     If context_id is provided, reuses the existing context (faster, maintains state).
-    If not provided, creates a new context.
+    If not provided, a cached context for this cluster/language is reused when
+    available — context creation takes 2-5 seconds, so repeat calls in a
+    session skip that cost. A stale cached context (e.g. after a cluster
+    restart) is detected and retried once on a fresh one automatically.
+
+    With wait=False, the command is submitted and this returns immediately with
+    a handle (cluster_id, context_id, command_id, status="Running"). Poll it
+    with get_command_status(). This enables firing several commands on
+    different contexts and collecting their results concurrently.
 
     By default, the context is kept alive for reuse. Set destroy_context_on_completion=True
     to destroy it after execution.
@@ -133,9 +146,21 @@ def execute_databricks_command(
         timeout: Maximum wait time in seconds (default: 120)
         destroy_context_on_completion: If True, destroys the context after execution.
                                        Default is False to allow reuse.
+        initial_interval: First status-poll delay in seconds (default: 0.25).
+                         Polls back off exponentially (x1.5) up to max_interval.
+        max_interval: Cap on the status-poll delay in seconds (default: 5.0)
+        wait: If True (default), block until the command completes. If False,
+              return a handle immediately and poll via get_command_status().
+              destroy_context_on_completion is ignored in this mode.
+        reuse_context: If True (default), reuse a cached execution context for
+              this cluster/language across calls. Set False to force a fresh
+              context (e.g. to guarantee a clean namespace).
 
     Returns:
-        Dictionary with:
+        When wait=False, a handle dictionary with cluster_id, context_id,
+        command_id, and status="Running".
+
+        Otherwise, dictionary with:
         - success: Whether execution succeeded
         - output: The output from execution
         - error: Error message if failed
@@ -163,7 +188,14 @@ def execute_databricks_command(
             language=language,
             timeout=timeout,
             destroy_context_on_completion=destroy_context_on_completion,
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+            wait=wait,
+            reuse_context=reuse_context,
         )
+        # wait=False returns the handle dict directly
+        if isinstance(result, dict):
+            return result
         return result.to_dict()
     except NoRunningClusterError as e:
         return {
@@ -181,6 +213,35 @@ def execute_databricks_command(
         }
 
 
+@mcp.tool
+def get_command_status(cluster_id: str, context_id: str, command_id: str) -> Dict[str, Any]:
+    """
+    Check on a command submitted with execute_databricks_command(wait=False).
+
+    Single status call, no waiting — call repeatedly (e.g. every few seconds)
+    until pending is False.
+
+    Args:
+        cluster_id: ID of the cluster the command runs on
+        context_id: ID of the execution context
+        command_id: Command ID from the wait=False handle
+
+    Returns:
+        Dictionary with:
+        - cluster_id / context_id / command_id: Echo of the handle
+        - status: Raw command status (Queued, Running, Finished, Error, ...)
+        - pending: True while the command is still in flight
+
+        Once pending is False, the execution result fields are included too:
+        - success: Whether execution succeeded
+        - output: The output from execution
+        - error: Error message if failed
+        - context_destroyed: Whether the context was destroyed
+        - message: Helpful message about reusing the context
+    """
+    return _get_command_status(cluster_id=cluster_id, context_id=context_id, command_id=command_id)
+
+
 @mcp.tool
 def run_python_file_on_databricks(
     file_path: str,
@@ -1,6 +1,6 @@
 """File tools - Upload files and folders to Databricks workspace."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from databricks_tools_core.file import (
     upload_folder as _upload_folder,
@@ -14,21 +14,25 @@ from ..server import mcp
 def upload_folder(
     local_folder: str,
     workspace_folder: str,
-    max_workers: int = 10,
+    max_workers: Optional[int] = None,
     overwrite: bool = True,
+    force: bool = False,
 ) -> Dict[str, Any]:
     """
     Upload an entire local folder to Databricks workspace.
 
     Uses parallel uploads with ThreadPoolExecutor for performance.
-    Automatically handles all file types.
+    Automatically handles all file types. Files unchanged since the last
+    upload of the same folder (by content hash) are skipped automatically.
 
     Args:
         local_folder: Path to local folder to upload
         workspace_folder: Target path in Databricks workspace
             (e.g., "/Workspace/Users/user@example.com/my-project")
-        max_workers: Maximum parallel upload threads (default: 10)
+        max_workers: Maximum parallel upload threads (default: 16, or the
+            DBX_UPLOAD_CONCURRENCY env var)
         overwrite: Whether to overwrite existing files (default: True)
+        force: If True, re-upload all files even if unchanged (default: False)
 
     Returns:
         Dictionary with upload statistics:
@@ -37,6 +41,7 @@ def upload_folder(
         - total_files: Number of files found
         - successful: Number of successful uploads
         - failed: Number of failed uploads
+        - skipped: Number of files skipped because they were unchanged
         - success: True if all uploads succeeded
     """
     result = _upload_folder(
@@ -44,6 +49,7 @@ def upload_folder(
         workspace_folder=workspace_folder,
         max_workers=max_workers,
         overwrite=overwrite,
+        force=force,
     )
     return {
         "local_folder": result.local_folder,
@@ -51,6 +57,7 @@ def upload_folder(
         "total_files": result.total_files,
         "successful": result.successful,
         "failed": result.failed,
+        "skipped": result.skipped,
         "success": result.success,
         "failed_uploads": [{"local_path": r.local_path, "error": r.error} for r in result.get_failed_uploads()]
         if result.failed > 0
@@ -12,12 +12,15 @@ from databricks_tools_core.spark_declarative_pipelines.pipelines import (
     get_update as _get_update,
     stop_pipeline as _stop_pipeline,
     get_pipeline_events as _get_pipeline_events,
+    get_pipeline_events_batch as _get_pipeline_events_batch,
     create_or_update_pipeline as _create_or_update_pipeline,
     find_pipeline_by_name as _find_pipeline_by_name,
+    wait_for_pipeline_update as _wait_for_pipeline_update,
 )
 
 from ..manifest import register_deleter
 from ..server import mcp
+from ._serialize import to_dict as _to_dict, to_dict_list as _to_dict_list
 
 
 def _delete_pipeline_resource(resource_id: str) -> None:
@@ -83,18 +86,20 @@ def create_pipeline(
 
 
 @mcp.tool
-def get_pipeline(pipeline_id: str) -> Dict[str, Any]:
+def get_pipeline(pipeline_id: str, use_cache: bool = True) -> Dict[str, Any]:
     """
     Get pipeline details and configuration.
 
     Args:
         pipeline_id: Pipeline ID
+        use_cache: If True (default), recent results (up to 30s old) may be
+            served from cache. Pass False to force a fresh fetch.
 
     Returns:
         Dictionary with pipeline configuration and state.
     """
-    result = _get_pipeline(pipeline_id=pipeline_id)
-    return result.as_dict() if hasattr(result, "as_dict") else vars(result)
+    result = _get_pipeline(pipeline_id=pipeline_id, use_cache=use_cache)
+    return _to_dict(result)
 
 
 @mcp.tool
@@ -201,7 +206,52 @@ def get_update(pipeline_id: str, update_id: str) -> Dict[str, Any]:
         Dictionary with update status (QUEUED, RUNNING, COMPLETED, FAILED, etc.)
     """
     result = _get_update(pipeline_id=pipeline_id, update_id=update_id)
-    return result.as_dict() if hasattr(result, "as_dict") else vars(result)
+    return _to_dict(result)
+
+
+@mcp.tool
+def wait_for_pipeline_update(
+    pipeline_id: str,
+    update_id: str,
+    timeout: int = 1800,
+    max_poll_interval: float = 30.0,
+) -> Dict[str, Any]:
+    """
+    Wait for a pipeline update to reach a terminal state.
+
+    Use this after start_update instead of calling get_update in a loop —
+    it polls server-side with exponential backoff and returns once the
+    update completes, fails, or is canceled.
+
+    Args:
+        pipeline_id: Pipeline ID
+        update_id: Update ID from start_update
+        timeout: Maximum wait time in seconds (default: 1800 = 30 minutes)
+        max_poll_interval: Cap on the backoff delay between status checks
+            in seconds (default: 30.0)
+
+    Returns:
+        Dictionary with:
+        - state: Final state (COMPLETED, FAILED, CANCELED)
+        - success: True if completed successfully
+        - duration_seconds: Total time waited
+        - errors: List of error details if the update failed
+    """
+    try:
+        return _wait_for_pipeline_update(
+            pipeline_id=pipeline_id,
+            update_id=update_id,
+            timeout=timeout,
+            max_interval=max_poll_interval,
+        )
+    except TimeoutError as e:
+        return {
+            "state": "TIMEOUT",
+            "success": False,
+            "update_id": update_id,
+            "errors": [],
+            "error_message": str(e),
+        }
 
 
 @mcp.tool
@@ -237,7 +287,36 @@ def get_pipeline_events(
         List of event dictionaries with error details.
     """
     events = _get_pipeline_events(pipeline_id=pipeline_id, max_results=max_results)
-    return [e.as_dict() if hasattr(e, "as_dict") else vars(e) for e in events]
+    return _to_dict_list(events)
+
+
+@mcp.tool
+def get_pipeline_events_batch(
+    pipeline_ids: List[str],
+    max_results: int = 100,
+) -> Dict[str, Any]:
+    """
+    Get events for multiple pipelines in one call.
+
+    Fetches all pipelines concurrently — much faster than calling
+    get_pipeline_events once per pipeline when debugging several
+    failing pipelines.
+
+    Args:
+        pipeline_ids: List of pipeline IDs
+        max_results: Maximum number of events per pipeline (default: 100)
+
+    Returns:
+        Dictionary mapping each pipeline ID to its list of event
+        dictionaries, or to {"error": <message>} if that pipeline's fetch
+        failed (e.g. deleted or inaccessible). The other pipelines'
+        events are still returned.
+    """
+    batches = _get_pipeline_events_batch(pipeline_ids=pipeline_ids, max_results=max_results)
+    return {
+        pipeline_id: events if isinstance(events, dict) else _to_dict_list(events)
+        for pipeline_id, events in batches.items()
+    }
 
 
 @mcp.tool
@@ -143,10 +143,12 @@ def _to_dict(obj: Any) -> Dict[str, Any]:
     """Convert SDK objects to serializable dicts."""
     if isinstance(obj, dict):
         return obj
-    if hasattr(obj, "as_dict"):
-        return obj.as_dict()
-    if hasattr(obj, "model_dump"):
-        return obj.model_dump(exclude_none=True)
+    as_dict = getattr(obj, "as_dict", None)
+    if as_dict is not None:
+        return as_dict()
+    model_dump = getattr(obj, "model_dump", None)
+    if model_dump is not None:
+        return model_dump(exclude_none=True)
     return vars(obj)
 
 
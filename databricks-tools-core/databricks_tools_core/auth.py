@@ -23,6 +23,7 @@ Usage in functions:
         # ...
 """
 
+import functools
 import logging
 import os
 from contextvars import ContextVar
@@ -73,35 +74,28 @@ def clear_databricks_auth() -> None:
     _token_ctx.set(None)
 
 
-def get_workspace_client() -> WorkspaceClient:
-    """Get a WorkspaceClient using context auth or environment variables.
-
-    Authentication priority:
-    1. If OAuth credentials exist in env, use explicit OAuth M2M auth (Databricks Apps)
-       - This explicitly sets auth_type to prevent conflicts with other auth methods
-    2. Context variables with explicit token (PAT auth for development)
-    3. Fall back to default authentication (env vars, config file)
+@functools.lru_cache(maxsize=32)
+def _build_client(
+    host: Optional[str],
+    token: Optional[str],
+    client_id: Optional[str],
+    client_secret: Optional[str],
+) -> WorkspaceClient:
+    """Build (and memoize) a WorkspaceClient for one set of credentials.
 
-    Returns:
-        Configured WorkspaceClient instance
+    Reusing the client keeps the SDK's underlying HTTP connection pool warm,
+    avoiding a fresh TLS handshake per tool call. Keyed on the resolved
+    credentials, so rotated tokens naturally get a new client while older
+    entries age out of the LRU.
     """
-    host = _host_ctx.get()
-    token = _token_ctx.get()
-
     # Common kwargs for product identification in user-agent
     product_kwargs = dict(product=PRODUCT_NAME, product_version=PRODUCT_VERSION)
 
-    # In Databricks Apps (OAuth credentials in env), explicitly use OAuth M2M
-    # This prevents the SDK from detecting other auth methods like PAT or config file
-    if _has_oauth_credentials():
-        oauth_host = host or os.environ.get("DATABRICKS_HOST", "")
-        client_id = os.environ.get("DATABRICKS_CLIENT_ID", "")
-        client_secret = os.environ.get("DATABRICKS_CLIENT_SECRET", "")
-
+    if client_id and client_secret:
         # Explicitly configure OAuth M2M to prevent auth conflicts
         return tag_client(
             WorkspaceClient(
-                host=oauth_host,
+                host=host or "",
                 client_id=client_id,
                 client_secret=client_secret,
                 **product_kwargs,
@@ -119,6 +113,38 @@ def get_workspace_client() -> WorkspaceClient:
     return tag_client(WorkspaceClient(**product_kwargs))
 
 
+def get_workspace_client() -> WorkspaceClient:
+    """Get a WorkspaceClient using context auth or environment variables.
+
+    Clients are cached per credential set so repeated tool calls reuse the
+    same pooled HTTP connections instead of rebuilding the client (and TLS
+    session) on every invocation.
+
+    Authentication priority:
+    1. If OAuth credentials exist in env, use explicit OAuth M2M auth (Databricks Apps)
+       - This explicitly sets auth_type to prevent conflicts with other auth methods
+    2. Context variables with explicit token (PAT auth for development)
+    3. Fall back to default authentication (env vars, config file)
+
+    Returns:
+        Configured WorkspaceClient instance
+    """
+    host = _host_ctx.get()
+    token = _token_ctx.get()
+
+    # In Databricks Apps (OAuth credentials in env), explicitly use OAuth M2M
+    # This prevents the SDK from detecting other auth methods like PAT or config file
+    if _has_oauth_credentials():
+        return _build_client(
+            host or os.environ.get("DATABRICKS_HOST", ""),
+            None,
+            os.environ.get("DATABRICKS_CLIENT_ID", ""),
+            os.environ.get("DATABRICKS_CLIENT_SECRET", ""),
+        )
+
+    return _build_client(host, token, None, None)
+
+
 def get_current_username() -> Optional[str]:
     """Get the current authenticated user's username (email).
 
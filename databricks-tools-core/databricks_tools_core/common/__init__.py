@@ -1,3 +1,5 @@
 """Common utilities shared across product lines."""
 
-__all__ = []
+from .polling import poll_until
+
+__all__ = ["poll_until"]
@@ -0,0 +1,49 @@
+"""Deadline-bounded polling with exponential backoff."""
+
+import time
+from typing import Callable, TypeVar
+
+T = TypeVar("T")
+
+
+def poll_until(
+    fetch: Callable[[], T],
+    is_terminal: Callable[[T], bool],
+    timeout: float,
+    initial_interval: float = 0.5,
+    factor: float = 1.5,
+    max_interval: float = 30.0,
+) -> T:
+    """Poll fetch() until is_terminal(result) is true or the deadline passes.
+
+    The delay between polls starts at initial_interval and grows by factor up
+    to max_interval, and the overall budget is enforced against a
+    time.monotonic() deadline — backoff never stretches the timeout.
+
+    Args:
+        fetch: Zero-arg callable performing one status fetch
+        is_terminal: Predicate deciding whether a fetched result is final
+        timeout: Total wall-clock budget in seconds
+        initial_interval: First poll delay in seconds
+        factor: Multiplier applied to the delay after each poll
+        max_interval: Hard cap on the poll delay in seconds
+
+    Returns:
+        The first fetched result for which is_terminal() is true
+
+    Raises:
+        TimeoutError: If no terminal result is observed within timeout
+    """
+    deadline = time.monotonic() + timeout
+    interval = initial_interval
+
+    result = fetch()
+    while not is_terminal(result):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Operation did not reach a terminal state within {timeout} seconds")
+        time.sleep(min(interval, remaining))
+        interval = min(interval * factor, max_interval)
+        result = fetch()
+
+    return result
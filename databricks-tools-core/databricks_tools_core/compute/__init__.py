@@ -13,6 +13,10 @@ from .execution import (
     get_cluster_status,
     create_context,
     destroy_context,
+    submit_command_with_context,
+    get_command_status,
+    wait_for_command,
+    execute_command_with_context,
     execute_databricks_command,
     run_python_file_on_databricks,
 )
@@ -26,6 +30,10 @@ __all__ = [
     "get_cluster_status",
     "create_context",
     "destroy_context",
+    "submit_command_with_context",
+    "get_command_status",
+    "wait_for_command",
+    "execute_command_with_context",
     "execute_databricks_command",
     "run_python_file_on_databricks",
 ]
@@ -5,8 +5,12 @@ Functions for executing code on Databricks clusters using execution contexts.
 Uses Databricks Command Execution API via SDK.
 """
 
-import datetime
-from typing import Optional, List, Dict, Any
+import atexit
+import functools
+import os
+import threading
+import time
+from typing import Optional, List, Dict, Any, Union
 from databricks.sdk.service.compute import (
     CommandStatus,
     ClusterSource,
@@ -17,6 +21,7 @@ from databricks.sdk.service.compute import (
 )
 
 from ..auth import get_workspace_client, get_current_username
+from ..common import poll_until
 
 import logging
 
@@ -100,6 +105,13 @@ _LANGUAGE_MAP = {
     "r": Language.R,
 }
 
+# Command statuses that mean "still in flight" — keep polling
+_PENDING_COMMAND_STATUSES = {
+    CommandStatus.QUEUED,
+    CommandStatus.RUNNING,
+    CommandStatus.CANCELLING,
+}
+
 
 def list_clusters(
     include_terminated: bool = True,
@@ -491,53 +503,209 @@ def destroy_context(cluster_id: str, context_id: str) -> None:
     """
     w = get_workspace_client()
     w.command_execution.destroy(cluster_id=cluster_id, context_id=context_id)
+    _cached_context_evict(context_id)
+
+
+# Cached execution contexts. Creating a context on a running cluster takes
+# 2-5 seconds, so execute_databricks_command reuses one per
+# (client, cluster, language) across calls instead of creating and destroying
+# a context every time. Entries expire after sitting idle for the TTL; keyed
+# per client so contexts are never shared across credentials.
+_CONTEXT_CACHE_TTL = 1800.0
+_CONTEXT_CACHE_MAX = 32
+_context_cache: Dict[Any, tuple] = {}  # (id(w), cluster_id, language) -> (expires_at, context_id, w)
+_context_cache_lock = threading.Lock()
+
+
+def _cached_context_get(w, cluster_id: str, language: str) -> Optional[str]:
+    """Return a cached context ID for this client/cluster/language, if fresh."""
+    key = (id(w), cluster_id, language)
+    now = time.monotonic()
+    with _context_cache_lock:
+        entry = _context_cache.get(key)
+        if entry is None:
+            return None
+        expires_at, context_id, _ = entry
+        if expires_at <= now:
+            del _context_cache[key]
+            return None
+        # Idle TTL: every hit pushes expiry out again
+        _context_cache[key] = (now + _CONTEXT_CACHE_TTL, context_id, w)
+        return context_id
+
+
+def _cached_context_store(w, cluster_id: str, language: str, context_id: str) -> None:
+    key = (id(w), cluster_id, language)
+    now = time.monotonic()
+    with _context_cache_lock:
+        for k in [k for k, v in _context_cache.items() if v[0] <= now]:
+            del _context_cache[k]
+        while len(_context_cache) >= _CONTEXT_CACHE_MAX:
+            del _context_cache[next(iter(_context_cache))]
+        _context_cache[key] = (now + _CONTEXT_CACHE_TTL, context_id, w)
+
+
+def _cached_context_evict(context_id: str) -> None:
+    """Drop any cache entries holding this context ID (e.g. after destroy)."""
+    with _context_cache_lock:
+        for k in [k for k, v in _context_cache.items() if v[1] == context_id]:
+            del _context_cache[k]
+
+
+@atexit.register
+def _destroy_cached_contexts() -> None:
+    """Best-effort destroy of all cached contexts at interpreter exit."""
+    with _context_cache_lock:
+        entries = list(_context_cache.items())
+        _context_cache.clear()
+    for (_, cluster_id, _language), (_, context_id, w) in entries:
+        try:
+            w.command_execution.destroy(cluster_id=cluster_id, context_id=context_id)
+        except Exception:
+            pass
+
+
+def _is_stale_context_error(e: Exception) -> bool:
+    """Heuristic for 'this execution context no longer exists' API errors.
+
+    Happens when a cached context outlives a cluster restart or the
+    server-side context expiry.
+    """
+    msg = str(e).lower()
+    return "context" in msg and (
+        "not found" in msg or "does not exist" in msg or "invalid" in msg or "destroyed" in msg
+    )
 
 
-def _execute_on_context(cluster_id: str, context_id: str, code: str, language: str, timeout: int) -> ExecutionResult:
+def submit_command_with_context(
+    cluster_id: str,
+    context_id: str,
+    code: str,
+    language: str,
+) -> str:
     """
-    Internal function to execute code on an existing context.
+    Submit code on an existing context without waiting for it to finish.
+
+    Fire-and-forget half of command execution: returns the command ID
+    immediately so the caller can run other work (or submit more commands)
+    and collect results later via wait_for_command() or get_command_status().
 
     Args:
         cluster_id: ID of the cluster
         context_id: ID of the execution context
         code: Code to execute
         language: Programming language
+
+    Returns:
+        Command ID string for polling
+
+    Raises:
+        DatabricksError: If API request fails
+    """
+    w = get_workspace_client()
+    lang_enum = _LANGUAGE_MAP.get(language.lower(), Language.PYTHON)
+
+    # Submit the command; the Wait object's response carries the command ID
+    waiter = w.command_execution.execute(
+        cluster_id=cluster_id, context_id=context_id, language=lang_enum, command=code
+    )
+    return waiter.response.id
+
+
+def get_command_status(cluster_id: str, context_id: str, command_id: str) -> Dict[str, Any]:
+    """
+    Get the current status of a submitted command (single API call, no waiting).
+
+    Use after submit_command_with_context() (or execute_databricks_command
+    with wait=False) to poll a command at the caller's own pace.
+
+    Args:
+        cluster_id: ID of the cluster
+        context_id: ID of the execution context
+        command_id: ID of the command to check
+
+    Returns:
+        Dict with cluster_id, context_id, command_id, status, and pending
+        (True while the command is still queued/running). Once the command
+        is terminal, the ExecutionResult fields (success, output, error, ...)
+        are merged in as well.
+    """
+    w = get_workspace_client()
+    status = w.command_execution.command_status(
+        cluster_id=cluster_id, context_id=context_id, command_id=command_id
+    )
+
+    pending = status.status in _PENDING_COMMAND_STATUSES
+    info: Dict[str, Any] = {
+        "cluster_id": cluster_id,
+        "context_id": context_id,
+        "command_id": command_id,
+        "status": status.status.value if status.status else None,
+        "pending": pending,
+    }
+    if not pending:
+        info.update(_result_from_terminal_status(status, cluster_id, context_id).to_dict())
+    return info
+
+
+def wait_for_command(
+    cluster_id: str,
+    context_id: str,
+    command_id: str,
+    timeout: int,
+    initial_interval: float = 0.25,
+    max_interval: float = 5.0,
+) -> ExecutionResult:
+    """
+    Poll a submitted command until it completes.
+
+    Polls the command status with exponential backoff: starting at
+    initial_interval and growing x1.5 per attempt up to max_interval. Short
+    commands are detected within ~250ms while long-running commands don't
+    hammer the API with a fixed short interval.
+
+    Args:
+        cluster_id: ID of the cluster
+        context_id: ID of the execution context
+        command_id: ID of the command (from submit_command_with_context)
         timeout: Maximum time to wait for execution (seconds)
+        initial_interval: First poll delay in seconds (default 0.25)
+        max_interval: Cap on the poll delay in seconds (default 5.0)
 
     Returns:
         ExecutionResult with output or error (context_id filled in but context_destroyed=False)
     """
     w = get_workspace_client()
-    lang_enum = _LANGUAGE_MAP.get(language.lower(), Language.PYTHON)
 
     try:
-        # Execute and wait for result with timeout
-        result = w.command_execution.execute(
-            cluster_id=cluster_id, context_id=context_id, language=lang_enum, command=code
-        ).result(timeout=datetime.timedelta(seconds=timeout))
-
-        # Check result status (compare with enum values)
-        if result.status == CommandStatus.FINISHED:
-            # Check if there was an error in the results
-            if result.results and result.results.result_type and result.results.result_type.value == "error":
-                error_msg = result.results.cause if result.results.cause else "Unknown error"
-                return ExecutionResult(
-                    success=False,
-                    error=error_msg,
-                    cluster_id=cluster_id,
-                    context_id=context_id,
-                    context_destroyed=False,
-                )
-            output = result.results.data if result.results and result.results.data else "Success (no output)"
-            return ExecutionResult(
-                success=True,
-                output=str(output),
-                cluster_id=cluster_id,
-                context_id=context_id,
-                context_destroyed=False,
-            )
-        elif result.status in [CommandStatus.ERROR, CommandStatus.CANCELLED]:
-            error_msg = result.results.cause if result.results and result.results.cause else "Unknown error"
+        result = poll_until(
+            lambda: w.command_execution.command_status(
+                cluster_id=cluster_id, context_id=context_id, command_id=command_id
+            ),
+            lambda r: r.status not in _PENDING_COMMAND_STATUSES,
+            timeout=timeout,
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+        )
+    except TimeoutError:
+        return ExecutionResult(
+            success=False,
+            error="Command timed out",
+            cluster_id=cluster_id,
+            context_id=context_id,
+            context_destroyed=False,
+        )
+
+    return _result_from_terminal_status(result, cluster_id, context_id)
+
+
+def _result_from_terminal_status(result, cluster_id: str, context_id: str) -> ExecutionResult:
+    """Convert a terminal CommandStatusResponse into an ExecutionResult."""
+    # Check result status (compare with enum values)
+    if result.status == CommandStatus.FINISHED:
+        # Check if there was an error in the results
+        if result.results and result.results.result_type and result.results.result_type.value == "error":
+            error_msg = result.results.cause if result.results.cause else "Unknown error"
             return ExecutionResult(
                 success=False,
                 error=error_msg,
@@ -545,23 +713,71 @@ def _execute_on_context(cluster_id: str, context_id: str, code: str, language: s
                 context_id=context_id,
                 context_destroyed=False,
             )
-        else:
-            return ExecutionResult(
-                success=False,
-                error=f"Unexpected status: {result.status}",
-                cluster_id=cluster_id,
-                context_id=context_id,
-                context_destroyed=False,
-            )
-
-    except TimeoutError:
+        output = result.results.data if result.results and result.results.data else "Success (no output)"
+        return ExecutionResult(
+            success=True,
+            output=str(output),
+            cluster_id=cluster_id,
+            context_id=context_id,
+            context_destroyed=False,
+        )
+    elif result.status in [CommandStatus.ERROR, CommandStatus.CANCELLED]:
+        error_msg = result.results.cause if result.results and result.results.cause else "Unknown error"
         return ExecutionResult(
             success=False,
-            error="Command timed out",
+            error=error_msg,
             cluster_id=cluster_id,
             context_id=context_id,
             context_destroyed=False,
         )
+    else:
+        return ExecutionResult(
+            success=False,
+            error=f"Unexpected status: {result.status}",
+            cluster_id=cluster_id,
+            context_id=context_id,
+            context_destroyed=False,
+        )
+
+
+def execute_command_with_context(
+    cluster_id: str,
+    context_id: str,
+    code: str,
+    language: str,
+    timeout: int,
+    initial_interval: float = 0.25,
+    max_interval: float = 5.0,
+) -> ExecutionResult:
+    """
+    Execute code on an existing context and poll until the command completes.
+
+    Convenience wrapper around submit_command_with_context() + wait_for_command()
+    for callers that want the blocking behavior.
+
+    Args:
+        cluster_id: ID of the cluster
+        context_id: ID of the execution context
+        code: Code to execute
+        language: Programming language
+        timeout: Maximum time to wait for execution (seconds)
+        initial_interval: First poll delay in seconds (default 0.25)
+        max_interval: Cap on the poll delay in seconds (default 5.0)
+
+    Returns:
+        ExecutionResult with output or error (context_id filled in but context_destroyed=False)
+    """
+    command_id = submit_command_with_context(
+        cluster_id=cluster_id, context_id=context_id, code=code, language=language
+    )
+    return wait_for_command(
+        cluster_id=cluster_id,
+        context_id=context_id,
+        command_id=command_id,
+        timeout=timeout,
+        initial_interval=initial_interval,
+        max_interval=max_interval,
+    )
 
 
 def execute_databricks_command(
@@ -571,16 +787,30 @@ def execute_databricks_command(
     language: str = "python",
     timeout: int = 120,
     destroy_context_on_completion: bool = False,
-) -> ExecutionResult:
+    initial_interval: float = 0.25,
+    max_interval: float = 5.0,
+    wait: bool = True,
+    reuse_context: bool = True,
+) -> Union[ExecutionResult, Dict[str, Any]]:
     """
     Execute code on a Databricks cluster.
 
     If context_id is provided, reuses the existing context (faster, maintains state).
-    If not provided, creates a new context.
+    If not provided, a cached context for this cluster/language is reused when
+    available (context creation takes 2-5 seconds); otherwise a new context is
+    created and cached. Set reuse_context=False to always create a fresh
+    context. If a cached context turns out to be stale (cluster restarted),
+    the call transparently retries once on a fresh context.
 
     By default, the context is kept alive for reuse. Set destroy_context_on_completion=True
     to destroy it after execution.
 
+    With wait=False, the command is submitted and a handle dict is returned
+    immediately instead of an ExecutionResult — useful for firing several
+    commands concurrently and polling them via get_command_status() or
+    wait_for_command(). In that mode destroy_context_on_completion is
+    ignored (the context must outlive the running command).
+
     Args:
         code: Code to execute
         cluster_id: ID of the cluster. If not provided, auto-selects a running cluster
@@ -591,9 +821,19 @@ def execute_databricks_command(
         timeout: Maximum time to wait for execution (seconds)
         destroy_context_on_completion: If True, destroys the context after execution.
                                        Default is False to allow reuse.
+        initial_interval: First status-poll delay in seconds (default 0.25)
+        max_interval: Cap on the status-poll delay in seconds (default 5.0)
+        wait: If True (default), block until the command completes. If False,
+              submit and return a handle dict with cluster_id, context_id,
+              command_id, and status="Running" immediately.
+        reuse_context: If True (default), reuse a cached execution context for
+              this cluster/language across calls instead of creating a new
+              one. Ignored when context_id is given or
+              destroy_context_on_completion is True.
 
     Returns:
-        ExecutionResult with output, error, and context info for reuse.
+        ExecutionResult with output, error, and context info for reuse, or a
+        handle dict when wait=False.
 
     Raises:
         NoRunningClusterError: If no cluster_id provided and no running cluster found
@@ -633,26 +873,49 @@ def execute_databricks_command(
                 startable_clusters=startable_clusters,
             )
 
-    # Create context if not provided
+    # Resolve a context: explicit > cached > freshly created. Contexts are
+    # only cached when the caller doesn't plan to destroy them.
+    cacheable = reuse_context and not destroy_context_on_completion
     context_created = False
+    context_from_cache = False
     if context_id is None:
-        context_id = create_context(cluster_id, language)
-        context_created = True
+        if cacheable:
+            w = get_workspace_client()
+            context_id = _cached_context_get(w, cluster_id, language)
+            context_from_cache = context_id is not None
+        if context_id is None:
+            context_id = create_context(cluster_id, language)
+            context_created = True
+            if cacheable:
+                _cached_context_store(w, cluster_id, language, context_id)
+
+    def _run(ctx_id: str) -> Union[ExecutionResult, Dict[str, Any]]:
+        if not wait:
+            # Fire-and-forget: hand back a handle the caller can poll
+            command_id = submit_command_with_context(
+                cluster_id=cluster_id, context_id=ctx_id, code=code, language=language
+            )
+            return {
+                "cluster_id": cluster_id,
+                "context_id": ctx_id,
+                "command_id": command_id,
+                "status": "Running",
+            }
 
-    try:
-        # Execute command
-        result = _execute_on_context(
+        result = execute_command_with_context(
             cluster_id=cluster_id,
-            context_id=context_id,
+            context_id=ctx_id,
             code=code,
             language=language,
             timeout=timeout,
+            initial_interval=initial_interval,
+            max_interval=max_interval,
         )
 
         # Destroy context if requested
         if destroy_context_on_completion:
             try:
-                destroy_context(cluster_id, context_id)
+                destroy_context(cluster_id, ctx_id)
                 result.context_destroyed = True
                 result.message = "Execution successful. Context was destroyed."
             except Exception:
@@ -660,7 +923,19 @@ def execute_databricks_command(
 
         return result
 
-    except Exception:
+    try:
+        return _run(context_id)
+    except Exception as e:
+        if context_from_cache and _is_stale_context_error(e):
+            # Cached context outlived the cluster/server-side expiry — retry
+            # once on a fresh context
+            logger.debug(f"Cached context {context_id} on {cluster_id} is stale, recreating: {e}")
+            _cached_context_evict(context_id)
+            context_id = create_context(cluster_id, language)
+            if cacheable:
+                _cached_context_store(w, cluster_id, language, context_id)
+            return _run(context_id)
+
         # If we created the context and there's an error, clean up
         if context_created and destroy_context_on_completion:
             try:
@@ -670,6 +945,18 @@ def execute_databricks_command(
         raise
 
 
+@functools.lru_cache(maxsize=128)
+def _read_script(path: str, mtime_ns: int, size: int) -> str:
+    """Read and decode a script file, cached on (path, mtime, size).
+
+    Binary read + single decode skips text-mode incremental decoding and
+    newline translation, which matters for multi-MB generated scripts. The
+    mtime/size key means re-running an unchanged file is served from memory.
+    """
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8")
+
+
 def run_python_file_on_databricks(
     file_path: str,
     cluster_id: Optional[str] = None,
@@ -716,17 +1003,41 @@ def run_python_file_on_databricks(
         ...     context_id=result.context_id
         ... )
     """
-    # Read the file contents
+    # Stat first: missing and empty files are handled without opening the
+    # file or contacting the cluster. An empty script is a no-op, so
+    # synthesize the result executing it would produce.
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            code = f.read()
+        st = os.stat(file_path)
+        if st.st_size == 0:
+            return ExecutionResult(
+                success=True,
+                output="Success (no output)",
+                cluster_id=cluster_id,
+                context_id=context_id,
+                context_destroyed=context_id is None,
+            )
     except FileNotFoundError:
         return ExecutionResult(success=False, error=f"File not found: {file_path}")
+    except OSError as e:
+        return ExecutionResult(success=False, error=f"Failed to read file {file_path}: {str(e)}")
+
+    # Keyed on (path, mtime, size) from the stat above, so repeat runs of an
+    # unchanged script (common in iterate-on-cluster workflows) skip the
+    # read+decode entirely; any edit to the file changes the key
+    try:
+        code = _read_script(os.path.abspath(file_path), st.st_mtime_ns, st.st_size)
     except Exception as e:
         return ExecutionResult(success=False, error=f"Failed to read file {file_path}: {str(e)}")
 
     if not code.strip():
-        return ExecutionResult(success=False, error=f"File is empty: {file_path}")
+        # Whitespace-only scripts are no-ops too
+        return ExecutionResult(
+            success=True,
+            output="Success (no output)",
+            cluster_id=cluster_id,
+            context_id=context_id,
+            context_destroyed=context_id is None,
+        )
 
     # Execute the code on Databricks
     return execute_databricks_command(
@@ -5,7 +5,9 @@ Functions for uploading files and folders to Databricks Workspace.
 Uses Databricks Workspace API via SDK.
 """
 
+import hashlib
 import io
+import json
 import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
@@ -26,6 +28,7 @@ class UploadResult:
     remote_path: str
     success: bool
     error: Optional[str] = None
+    skipped: bool = False
 
 
 @dataclass
@@ -37,6 +40,7 @@ class FolderUploadResult:
     total_files: int
     successful: int
     failed: int
+    skipped: int = 0
     results: List[UploadResult] = field(default_factory=list)
 
     @property
@@ -81,6 +85,33 @@ def _upload_single_file(w: WorkspaceClient, local_path: str, remote_path: str, o
         return UploadResult(local_path=local_path, remote_path=remote_path, success=False, error=str(e))
 
 
+# Manifest of {relative_path: sha256} persisted in the workspace folder so
+# re-uploads of an unchanged folder skip the network entirely
+_MANIFEST_NAME = ".upload_manifest.json"
+
+
+def _load_manifest(w: WorkspaceClient, workspace_folder: str) -> dict:
+    """Load the content-hash manifest from the workspace (empty if missing)."""
+    try:
+        with w.workspace.download(f"{workspace_folder}/{_MANIFEST_NAME}") as f:
+            return json.loads(f.read())
+    except Exception:
+        return {}
+
+
+def _save_manifest(w: WorkspaceClient, workspace_folder: str, manifest: dict) -> None:
+    """Persist the content-hash manifest next to the uploaded files (best effort)."""
+    try:
+        w.workspace.upload(
+            path=f"{workspace_folder}/{_MANIFEST_NAME}",
+            content=io.BytesIO(json.dumps(manifest).encode("utf-8")),
+            format=ImportFormat.AUTO,
+            overwrite=True,
+        )
+    except Exception:
+        pass
+
+
 def _collect_files(local_folder: str) -> List[tuple]:
     """
     Collect all files in a folder recursively.
@@ -138,20 +169,31 @@ def _collect_directories(local_folder: str) -> List[str]:
 
 
 def upload_folder(
-    local_folder: str, workspace_folder: str, max_workers: int = 10, overwrite: bool = True
+    local_folder: str,
+    workspace_folder: str,
+    max_workers: Optional[int] = None,
+    overwrite: bool = True,
+    force: bool = False,
 ) -> FolderUploadResult:
     """
     Upload an entire local folder to Databricks workspace.
 
-    Uses parallel uploads with ThreadPoolExecutor for performance.
+    Uses parallel uploads with ThreadPoolExecutor for performance; directory
+    creation is parallelized the same way.
     Automatically handles all file types using ImportFormat.AUTO.
 
+    Files whose content hash matches the manifest from the previous upload
+    (persisted as .upload_manifest.json in the workspace folder) are skipped,
+    so iterative re-uploads only transfer what changed.
+
     Args:
         local_folder: Path to local folder to upload
         workspace_folder: Target path in Databricks workspace
             (e.g., "/Users/user@example.com/my-project")
-        max_workers: Maximum number of parallel upload threads (default: 10)
+        max_workers: Maximum number of parallel upload threads. Defaults to
+            the DBX_UPLOAD_CONCURRENCY env var, or 16.
         overwrite: Whether to overwrite existing files (default: True)
+        force: If True, re-upload every file regardless of the manifest
 
     Returns:
         FolderUploadResult with upload statistics and individual results
@@ -180,51 +222,73 @@ def upload_folder(
     # Normalize workspace path (remove trailing slash)
     workspace_folder = workspace_folder.rstrip("/")
 
+    if max_workers is None:
+        max_workers = int(os.environ.get("DBX_UPLOAD_CONCURRENCY", "16"))
+
     # Initialize client
     w = get_workspace_client()
 
-    # Create all directories first
-    directories = _collect_directories(local_folder)
-    for dir_path in directories:
-        remote_dir = f"{workspace_folder}/{dir_path}"
+    def _mkdir(remote_dir: str) -> None:
         try:
             w.workspace.mkdirs(remote_dir)
         except Exception:
             # Directory might already exist, ignore
             pass
 
-    # Create the root directory too
-    try:
-        w.workspace.mkdirs(workspace_folder)
-    except Exception:
-        pass
+    # mkdirs creates intermediate directories, so only the deepest (leaf)
+    # directories need a call; parents come for free
+    directories = _collect_directories(local_folder)
+    leaf_dirs = [
+        d for d in directories
+        if not any(other.startswith(d + os.sep) for other in directories if other != d)
+    ]
 
     # Collect all files
     files = _collect_files(local_folder)
 
-    if not files:
-        return FolderUploadResult(
-            local_folder=local_folder,
-            remote_folder=workspace_folder,
-            total_files=0,
-            successful=0,
-            failed=0,
-            results=[],
-        )
+    # Hash local files and diff against the previous upload's manifest
+    manifest = {} if force else _load_manifest(w, workspace_folder)
+    updated_manifest = dict(manifest)
 
-    # Upload files in parallel
+    to_upload = []  # (local_path, rel_key, digest)
     results = []
     successful = 0
     failed = 0
+    skipped = 0
+
+    for local_path, rel_path in files:
+        rel_key = rel_path.replace(os.sep, "/")
+        try:
+            with open(local_path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+        except Exception:
+            digest = None
+
+        if digest is not None and manifest.get(rel_key) == digest:
+            skipped += 1
+            results.append(
+                UploadResult(
+                    local_path=local_path,
+                    remote_path=f"{workspace_folder}/{rel_key}",
+                    success=True,
+                    skipped=True,
+                )
+            )
+            continue
+
+        to_upload.append((local_path, rel_key, digest))
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Create the root directory, then fan out leaf directory creation
+        _mkdir(workspace_folder)
+        list(executor.map(_mkdir, (f"{workspace_folder}/{d.replace(os.sep, '/')}" for d in leaf_dirs)))
+
         # Submit all upload tasks
         future_to_file = {}
-        for local_path, rel_path in files:
-            # Convert Windows paths to forward slashes for workspace
-            remote_path = f"{workspace_folder}/{rel_path.replace(os.sep, '/')}"
+        for local_path, rel_key, digest in to_upload:
+            remote_path = f"{workspace_folder}/{rel_key}"
             future = executor.submit(_upload_single_file, w, local_path, remote_path, overwrite)
-            future_to_file[future] = (local_path, remote_path)
+            future_to_file[future] = (rel_key, digest)
 
         # Collect results as they complete
         for future in as_completed(future_to_file):
@@ -232,15 +296,22 @@ def upload_folder(
             results.append(result)
             if result.success:
                 successful += 1
+                rel_key, digest = future_to_file[future]
+                if digest is not None:
+                    updated_manifest[rel_key] = digest
             else:
                 failed += 1
 
+    if successful > 0 or (force and files):
+        _save_manifest(w, workspace_folder, updated_manifest)
+
     return FolderUploadResult(
         local_folder=local_folder,
         remote_folder=workspace_folder,
         total_files=len(files),
         successful=successful,
         failed=failed,
+        skipped=skipped,
         results=results,
     )
 
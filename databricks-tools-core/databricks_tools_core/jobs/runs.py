@@ -112,7 +112,8 @@ def run_job_now(
             return response.run_id
         else:
             # Fallback: try to get it from as_dict()
-            response_dict = response.as_dict() if hasattr(response, "as_dict") else {}
+            as_dict = getattr(response, "as_dict", None)
+            response_dict = as_dict() if as_dict is not None else {}
             if "run_id" in response_dict:
                 return response_dict["run_id"]
             raise JobError(f"Failed to extract run_id from response for job {job_id}", job_id=job_id)
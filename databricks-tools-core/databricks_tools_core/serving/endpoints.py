@@ -195,7 +195,8 @@ def query_serving_endpoint(
 
     # If empty, return raw response as dict
     if not result:
-        result = response.as_dict() if hasattr(response, "as_dict") else {"raw": str(response)}
+        as_dict = getattr(response, "as_dict", None)
+        result = as_dict() if as_dict is not None else {"raw": str(response)}
 
     return result
 
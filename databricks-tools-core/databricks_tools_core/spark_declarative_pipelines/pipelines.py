@@ -5,7 +5,9 @@ Functions for managing SDP pipeline lifecycle using Databricks Pipelines API.
 All pipelines use Unity Catalog and serverless compute by default.
 """
 
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from typing import List, Optional, Dict, Any
 
@@ -31,6 +33,7 @@ from databricks.sdk.service.pipelines import (
 )
 
 from ..auth import get_workspace_client
+from ..common import poll_until
 
 
 # Fields that are not valid SDK parameters and should be filtered out
@@ -269,18 +272,60 @@ def create_pipeline(
     return w.pipelines.create(**kwargs)
 
 
-def get_pipeline(pipeline_id: str) -> GetPipelineResponse:
+# Short-TTL cache for pipeline metadata: agent workflows interleave
+# get_pipeline with start_update/get_update polling on the same pipeline,
+# and the config rarely changes between those calls. Entries are keyed per
+# client so cached metadata never crosses authentication contexts; the
+# client is stored in the value to pin it — otherwise a garbage-collected
+# client's id() could be reused by a client for different credentials
+# within the TTL and be served another principal's metadata.
+_PIPELINE_CACHE_TTL = 30.0
+_PIPELINE_CACHE_MAX = 256
+_pipeline_cache: Dict[Any, tuple] = {}  # (id(w), pipeline_id) -> (expires_at, response, w)
+_pipeline_cache_lock = threading.Lock()
+
+
+def _invalidate_pipeline_cache(pipeline_id: str) -> None:
+    """Drop cached metadata for a pipeline (after update/delete)."""
+    with _pipeline_cache_lock:
+        for key in [k for k in _pipeline_cache if k[1] == pipeline_id]:
+            del _pipeline_cache[key]
+
+
+def get_pipeline(pipeline_id: str, use_cache: bool = True) -> GetPipelineResponse:
     """
     Get pipeline details and configuration.
 
     Args:
         pipeline_id: Pipeline ID
+        use_cache: If True (default), serve from a 30s-TTL cache when possible.
+            Pass False to force a fresh fetch from the API.
 
     Returns:
         GetPipelineResponse with full pipeline configuration and state
     """
     w = get_workspace_client()
-    return w.pipelines.get(pipeline_id=pipeline_id)
+    key = (id(w), pipeline_id)
+
+    if use_cache:
+        with _pipeline_cache_lock:
+            entry = _pipeline_cache.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+    response = w.pipelines.get(pipeline_id=pipeline_id)
+
+    with _pipeline_cache_lock:
+        if len(_pipeline_cache) >= _PIPELINE_CACHE_MAX:
+            now = time.monotonic()
+            for k in [k for k, (expires_at, _, _w) in _pipeline_cache.items() if expires_at <= now]:
+                del _pipeline_cache[k]
+            if len(_pipeline_cache) >= _PIPELINE_CACHE_MAX:
+                # Still full after dropping expired entries: evict the oldest
+                _pipeline_cache.pop(next(iter(_pipeline_cache)))
+        _pipeline_cache[key] = (time.monotonic() + _PIPELINE_CACHE_TTL, response, w)
+
+    return response
 
 
 def update_pipeline(
@@ -335,6 +380,7 @@ def update_pipeline(
         kwargs["id"] = pipeline_id
 
     w.pipelines.update(**kwargs)
+    _invalidate_pipeline_cache(pipeline_id)
 
 
 def delete_pipeline(pipeline_id: str) -> None:
@@ -346,6 +392,7 @@ def delete_pipeline(pipeline_id: str) -> None:
     """
     w = get_workspace_client()
     w.pipelines.delete(pipeline_id=pipeline_id)
+    _invalidate_pipeline_cache(pipeline_id)
 
 
 def start_update(
@@ -425,17 +472,71 @@ def get_pipeline_events(pipeline_id: str, max_results: int = 100) -> List[Pipeli
     return list(events)
 
 
+def get_pipeline_events_batch(
+    pipeline_ids: List[str],
+    max_results: int = 100,
+    max_workers: int = 16,
+) -> Dict[str, Any]:
+    """
+    Get events for multiple pipelines concurrently.
+
+    Fetches each pipeline's events in parallel (the SDK client is
+    thread-safe), so debugging N pipelines costs roughly one round-trip
+    instead of N sequential ones.
+
+    Args:
+        pipeline_ids: Pipeline IDs to fetch events for
+        max_results: Maximum number of events per pipeline
+        max_workers: Maximum concurrent fetches (default: 16)
+
+    Returns:
+        Dict mapping each pipeline ID to its list of PipelineEvent objects.
+        A pipeline whose fetch fails (deleted, inaccessible) maps to
+        {"error": <message>} instead — one bad ID doesn't discard the
+        other pipelines' events.
+    """
+    results: Dict[str, Any] = {}
+    if not pipeline_ids:
+        return results
+
+    # One client shared across workers to reuse its connection pool
+    w = get_workspace_client()
+
+    def _fetch(pipeline_id: str) -> List[PipelineEvent]:
+        return list(w.pipelines.list_pipeline_events(pipeline_id=pipeline_id, max_results=max_results))
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(pipeline_ids))) as executor:
+        futures = {executor.submit(_fetch, pid): pid for pid in pipeline_ids}
+        for future in as_completed(futures):
+            pipeline_id = futures[future]
+            try:
+                results[pipeline_id] = future.result()
+            except Exception as e:
+                results[pipeline_id] = {"error": str(e)}
+
+    return results
+
+
 def wait_for_pipeline_update(
-    pipeline_id: str, update_id: str, timeout: int = 1800, poll_interval: int = 5
+    pipeline_id: str,
+    update_id: str,
+    timeout: int = 1800,
+    initial_interval: float = 1.0,
+    max_interval: float = 30.0,
 ) -> Dict[str, Any]:
     """
     Wait for a pipeline update to complete and return detailed results.
 
+    Polls get_update with exponential backoff (x1.5 per attempt, capped at
+    max_interval), so short updates are detected quickly while long ones
+    don't hammer the API at a fixed rate.
+
     Args:
         pipeline_id: Pipeline ID
         update_id: Update ID from start_update
         timeout: Maximum wait time in seconds (default: 30 minutes)
-        poll_interval: Time between status checks in seconds
+        initial_interval: First poll delay in seconds (default: 1.0)
+        max_interval: Cap on the poll delay in seconds (default: 30.0)
 
     Returns:
         Dictionary with detailed update results:
@@ -450,41 +551,35 @@ def wait_for_pipeline_update(
     w = get_workspace_client()
     start_time = time.time()
 
-    while True:
-        elapsed = time.time() - start_time
-
-        if elapsed > timeout:
-            raise TimeoutError(
-                f"Pipeline update {update_id} did not complete within {timeout} seconds. "
-                f"Check status in UI or call get_update(pipeline_id='{pipeline_id}', update_id='{update_id}')."
-            )
-
-        response = w.pipelines.get_update(pipeline_id=pipeline_id, update_id=update_id)
-
-        update_info = response.update
-        if not update_info:
-            time.sleep(poll_interval)
-            continue
-
-        state = update_info.state
-
-        if state in TERMINAL_STATES:
-            result = {
-                "state": state.value if state else None,
-                "success": state == UpdateInfoState.COMPLETED,
-                "duration_seconds": round(elapsed, 2),
-                "update_id": update_id,
-                "errors": [],
-            }
+    try:
+        response = poll_until(
+            lambda: w.pipelines.get_update(pipeline_id=pipeline_id, update_id=update_id),
+            lambda r: bool(r.update) and r.update.state in TERMINAL_STATES,
+            timeout=timeout,
+            initial_interval=initial_interval,
+            max_interval=max_interval,
+        )
+    except TimeoutError:
+        raise TimeoutError(
+            f"Pipeline update {update_id} did not complete within {timeout} seconds. "
+            f"Check status in UI or call get_update(pipeline_id='{pipeline_id}', update_id='{update_id}')."
+        )
 
-            # If failed, get detailed error information
-            if state == UpdateInfoState.FAILED:
-                events = get_pipeline_events(pipeline_id, max_results=50)
-                result["errors"] = _extract_error_details(events)
+    state = response.update.state
+    result = {
+        "state": state.value if state else None,
+        "success": state == UpdateInfoState.COMPLETED,
+        "duration_seconds": round(time.time() - start_time, 2),
+        "update_id": update_id,
+        "errors": [],
+    }
 
-            return result
+    # If failed, get detailed error information
+    if state == UpdateInfoState.FAILED:
+        events = get_pipeline_events(pipeline_id, max_results=50)
+        result["errors"] = _extract_error_details(events)
 
-        time.sleep(poll_interval)
+    return result
 
 
 def create_or_update_pipeline(
@@ -7,7 +7,7 @@ import logging
 from typing import Any, Dict, List, Optional
 
 from databricks.sdk import WorkspaceClient
-from databricks.sdk.service.sql import StatementState
+from databricks.sdk.service.sql import ExecuteStatementRequestOnWaitTimeout, StatementState
 
 from ...auth import get_workspace_client
 
@@ -69,11 +69,18 @@ class SQLExecutor:
         """
         logger.debug(f"Executing SQL query: {sql_query[:100]}...")
 
+        # Long-poll server-side: the API blocks up to wait_timeout (5s-50s) and
+        # usually returns the finished statement in the submit response, so most
+        # queries never need a get_statement round-trip. CONTINUE keeps the
+        # statement running past the wait window so we can fall back to polling.
+        wait_seconds = min(50, max(5, int(timeout)))
+
         # Build execution parameters
         exec_params = {
             "warehouse_id": self.warehouse_id,
             "statement": sql_query,
-            "wait_timeout": "0s",  # Immediate return, we poll manually
+            "wait_timeout": f"{wait_seconds}s",
+            "on_wait_timeout": ExecuteStatementRequestOnWaitTimeout.CONTINUE,
         }
         if catalog:
             exec_params["catalog"] = catalog
@@ -82,28 +89,25 @@ class SQLExecutor:
         if row_limit is not None:
             exec_params["row_limit"] = row_limit
 
+        # The server-side wait counts toward the caller's timeout budget
+        deadline = time.monotonic() + timeout
+
         # Submit the statement
         try:
-            response = self.client.statement_execution.execute_statement(**exec_params)
+            status = self.client.statement_execution.execute_statement(**exec_params)
         except Exception as e:
             raise SQLExecutionError(
                 f"Failed to submit SQL query to warehouse '{self.warehouse_id}': {str(e)}. "
                 f"Check that the warehouse exists and is accessible."
             )
 
-        statement_id = response.statement_id
+        statement_id = status.statement_id
         logger.debug(f"Statement submitted with ID: {statement_id}")
 
-        # Poll for completion
+        # Fall back to polling for statements still running after the wait window
         poll_interval = 2
-        elapsed = 0
-
-        while elapsed < timeout:
-            try:
-                status = self.client.statement_execution.get_statement(statement_id=statement_id)
-            except Exception as e:
-                raise SQLExecutionError(f"Failed to check status of statement '{statement_id}': {str(e)}")
 
+        while True:
             state = status.status.state
 
             if state == StatementState.SUCCEEDED:
@@ -121,9 +125,15 @@ class SQLExecutor:
             if state == StatementState.CLOSED:
                 raise SQLExecutionError(f"SQL statement was closed unexpectedly. Statement ID: {statement_id}")
 
+            if time.monotonic() >= deadline:
+                break
+
             # Still running, wait and poll again
             time.sleep(poll_interval)
-            elapsed += poll_interval
+            try:
+                status = self.client.statement_execution.get_statement(statement_id=statement_id)
+            except Exception as e:
+                raise SQLExecutionError(f"Failed to check status of statement '{statement_id}': {str(e)}")
 
         # Timeout reached - cancel the statement
         self._cancel_statement(statement_id)
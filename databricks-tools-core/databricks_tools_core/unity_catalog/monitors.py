@@ -9,6 +9,16 @@ from typing import Any, Dict, List, Optional
 from ..auth import get_workspace_client
 
 
+def _to_dict(obj: Any) -> Dict[str, Any]:
+    """Convert an SDK response object to a plain dict.
+
+    Single getattr with a default instead of hasattr + call, which does the
+    same lookup twice.
+    """
+    as_dict = getattr(obj, "as_dict", None)
+    return as_dict() if as_dict is not None else vars(obj)
+
+
 def create_monitor(
     table_name: str,
     output_schema_name: str,
@@ -84,7 +94,7 @@ def create_monitor(
         )
 
     result = w.quality_monitors.create(**kwargs)
-    return result.as_dict() if hasattr(result, "as_dict") else vars(result)
+    return _to_dict(result)
 
 
 def get_monitor(table_name: str) -> Dict[str, Any]:
@@ -102,7 +112,7 @@ def get_monitor(table_name: str) -> Dict[str, Any]:
     """
     w = get_workspace_client()
     result = w.quality_monitors.get(table_name=table_name)
-    return result.as_dict() if hasattr(result, "as_dict") else vars(result)
+    return _to_dict(result)
 
 
 def run_monitor_refresh(table_name: str) -> Dict[str, Any]:
@@ -120,7 +130,7 @@ def run_monitor_refresh(table_name: str) -> Dict[str, Any]:
     """
     w = get_workspace_client()
     result = w.quality_monitors.run_refresh(table_name=table_name)
-    return result.as_dict() if hasattr(result, "as_dict") else vars(result)
+    return _to_dict(result)
 
 
 def list_monitor_refreshes(table_name: str) -> List[Dict[str, Any]]:
@@ -138,7 +148,7 @@ def list_monitor_refreshes(table_name: str) -> List[Dict[str, Any]]:
     """
     w = get_workspace_client()
     result = w.quality_monitors.list_refreshes(table_name=table_name)
-    return [r.as_dict() if hasattr(r, "as_dict") else vars(r) for r in (result.refreshes or [])]
+    return [_to_dict(r) for r in (result.refreshes or [])]
 
 
 def delete_monitor(table_name: str) -> None:
@@ -9,6 +9,17 @@ from typing import Any, Dict, List, Optional
 from ..auth import get_workspace_client
 
 
+def _to_dict(obj: Any) -> Dict[str, Any]:
+    """Convert an SDK response object to a plain dict.
+
+    Single getattr with a default instead of hasattr + call — hasattr is
+    itself a getattr under the hood, so this halves the attribute lookups
+    on list-returning endpoints.
+    """
+    as_dict = getattr(obj, "as_dict", None)
+    return as_dict() if as_dict is not None else vars(obj)
+
+
 # --- Shares ---
 
 
@@ -24,7 +35,7 @@ def list_shares() -> List[Dict[str, Any]]:
     """
     w = get_workspace_client()
     shares = list(w.shares.list_shares())
-    return [s.as_dict() if hasattr(s, "as_dict") else vars(s) for s in shares]
+    return [_to_dict(s) for s in shares]
 
 
 def get_share(name: str, include_shared_data: bool = True) -> Dict[str, Any]:
@@ -43,7 +54,7 @@ def get_share(name: str, include_shared_data: bool = True) -> Dict[str, Any]:
     """
     w = get_workspace_client()
     result = w.shares.get(name=name, include_shared_data=include_shared_data)
-    return result.as_dict() if hasattr(result, "as_dict") else vars(result)
+    return _to_dict(result)
 
 
 def create_share(
@@ -68,7 +79,7 @@ def create_share(
     if comment is not None:
         kwargs["comment"] = comment
     result = w.shares.create(**kwargs)
-    return result.as_dict() if hasattr(result, "as_dict") else vars(result)
+    return _to_dict(result)
 
 
 def add_table_to_share(
@@ -121,7 +132,7 @@ def add_table_to_share(
             )
         ],
     )
-    return result.as_dict() if hasattr(result, "as_dict") else vars(result)
+    return _to_dict(result)
 
 
 def remove_table_from_share(
@@ -161,7 +172,7 @@ def remove_table_from_share(
             )
         ],
     )
-    return result.as_dict() if hasattr(result, "as_dict") else vars(result)
+    return _to_dict(result)
 
 
 def delete_share(name: str) -> None:
@@ -257,7 +268,7 @@ def list_recipients() -> List[Dict[str, Any]]:
     """
     w = get_workspace_client()
     recipients = list(w.recipients.list())
-    return [r.as_dict() if hasattr(r, "as_dict") else vars(r) for r in recipients]
+    return [_to_dict(r) for r in recipients]
 
 
 def get_recipient(name: str) -> Dict[str, Any]:
@@ -275,7 +286,7 @@ def get_recipient(name: str) -> Dict[str, Any]:
     """
     w = get_workspace_client()
     result = w.recipients.get(name=name)
-    return result.as_dict() if hasattr(result, "as_dict") else vars(result)
+    return _to_dict(result)
 
 
 def create_recipient(
@@ -318,7 +329,7 @@ def create_recipient(
         kwargs["ip_access_list"] = IpAccessList(allowed_ip_addresses=ip_access_list)
 
     result = w.recipients.create(**kwargs)
-    return result.as_dict() if hasattr(result, "as_dict") else vars(result)
+    return _to_dict(result)
 
 
 def rotate_recipient_token(name: str) -> Dict[str, Any]:
@@ -336,7 +347,7 @@ def rotate_recipient_token(name: str) -> Dict[str, Any]:
     """
     w = get_workspace_client()
     result = w.recipients.rotate_token(name=name, existing_token_expire_in_seconds=0)
-    return result.as_dict() if hasattr(result, "as_dict") else vars(result)
+    return _to_dict(result)
 
 
 def delete_recipient(name: str) -> None:
@@ -368,7 +379,7 @@ def list_providers() -> List[Dict[str, Any]]:
     """
     w = get_workspace_client()
     providers = list(w.providers.list())
-    return [p.as_dict() if hasattr(p, "as_dict") else vars(p) for p in providers]
+    return [_to_dict(p) for p in providers]
 
 
 def get_provider(name: str) -> Dict[str, Any]:
@@ -386,7 +397,7 @@ def get_provider(name: str) -> Dict[str, Any]:
     """
     w = get_workspace_client()
     result = w.providers.get(name=name)
-    return result.as_dict() if hasattr(result, "as_dict") else vars(result)
+    return _to_dict(result)
 
 
 def list_provider_shares(name: str) -> List[Dict[str, Any]]:
@@ -404,4 +415,4 @@ def list_provider_shares(name: str) -> List[Dict[str, Any]]:
     """
     w = get_workspace_client()
     shares = list(w.providers.list_shares(name=name))
-    return [s.as_dict() if hasattr(s, "as_dict") else vars(s) for s in shares]
+    return [_to_dict(s) for s in shares]
@@ -559,7 +559,7 @@ def scan_vs_index(
             if isinstance(data, list) and len(data) > 0:
                 # Extract column names from first entry
                 first = data[0]
-                if hasattr(first, "as_dict"):
+                if getattr(first, "as_dict", None) is not None:
                     rows = [d.as_dict() for d in data]
                 elif isinstance(first, dict):
                     rows = data
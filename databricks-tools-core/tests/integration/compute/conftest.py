@@ -0,0 +1,44 @@
+"""Shared fixtures for compute integration tests."""
+
+import pytest
+
+from databricks_tools_core.compute import (
+    execute_databricks_command,
+    get_best_cluster,
+    destroy_context,
+)
+
+
+@pytest.fixture(scope="session")
+def shared_context():
+    """
+    Create a shared execution context for tests that need cluster execution.
+
+    Session-scoped so the context bootstrap (~5-10s) is paid once and
+    amortized across every test in the session instead of per test.
+    """
+    # Get a running cluster
+    cluster_id = get_best_cluster()
+    if cluster_id is None:
+        pytest.skip("No running cluster available")
+
+    # Create context with first execution
+    result = execute_databricks_command(
+        code='print("Context initialized")',
+        cluster_id=cluster_id,
+        timeout=120,
+    )
+
+    if not result.success:
+        pytest.fail(f"Failed to create shared context: {result.error}")
+
+    yield {
+        "cluster_id": result.cluster_id,
+        "context_id": result.context_id,
+    }
+
+    # Cleanup
+    try:
+        destroy_context(result.cluster_id, result.context_id)
+    except Exception:
+        pass  # Ignore cleanup errors
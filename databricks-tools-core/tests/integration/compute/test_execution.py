@@ -4,55 +4,18 @@ Integration tests for compute execution functions.
 Tests execute_databricks_command and run_python_file_on_databricks with a real cluster.
 """
 
-import tempfile
 import pytest
-from pathlib import Path
 
 from databricks_tools_core.compute import (
+    execute_command_with_context,
     execute_databricks_command,
     run_python_file_on_databricks,
     list_clusters,
     get_best_cluster,
-    destroy_context,
     NoRunningClusterError,
 )
 
 
-@pytest.fixture(scope="module")
-def shared_context():
-    """
-    Create a shared execution context for tests that need cluster execution.
-
-    This speeds up tests by reusing the same context instead of creating
-    a new one for each test (context creation takes ~5-10s).
-    """
-    # Get a running cluster
-    cluster_id = get_best_cluster()
-    if cluster_id is None:
-        pytest.skip("No running cluster available")
-
-    # Create context with first execution
-    result = execute_databricks_command(
-        code='print("Context initialized")',
-        cluster_id=cluster_id,
-        timeout=120,
-    )
-
-    if not result.success:
-        pytest.fail(f"Failed to create shared context: {result.error}")
-
-    yield {
-        "cluster_id": result.cluster_id,
-        "context_id": result.context_id,
-    }
-
-    # Cleanup
-    try:
-        destroy_context(result.cluster_id, result.context_id)
-    except Exception:
-        pass  # Ignore cleanup errors
-
-
 @pytest.mark.integration
 class TestListClusters:
     """Tests for list_clusters function."""
@@ -150,6 +113,24 @@ class TestExecuteDatabricksCommand:
         assert result2.success, f"Second execution failed: {result2.error}"
         assert "test_var is still 42" in result2.output
 
+    def test_execute_command_with_context(self, shared_context):
+        """Should execute directly on an existing context via the low-level API."""
+        result = execute_command_with_context(
+            cluster_id=shared_context["cluster_id"],
+            context_id=shared_context["context_id"],
+            code='print("direct context call")',
+            language="python",
+            timeout=120,
+        )
+
+        print("\n=== Direct Context Execution ===")
+        print(f"Success: {result.success}")
+        print(f"Output: {result.output}")
+
+        assert result.success, f"Execution failed: {result.error}"
+        assert "direct context call" in result.output
+        assert result.context_destroyed is False
+
     def test_sql_execution(self, shared_context):
         """Should execute SQL queries."""
         result = execute_databricks_command(
@@ -190,91 +171,56 @@ class TestExecuteDatabricksCommand:
 class TestRunPythonFileOnDatabricks:
     """Tests for run_python_file_on_databricks function."""
 
-    def test_simple_file_execution(self, shared_context):
-        """Should execute a simple Python file."""
-        code = 'print("Hello from file!")\nprint(2 + 2)'
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(code)
-            f.flush()
-            temp_path = f.name
+    @pytest.mark.parametrize(
+        ("code", "expected_substring", "should_succeed"),
+        [
+            pytest.param(
+                'print("Hello from file!")\nprint(2 + 2)',
+                "Hello from file!",
+                True,
+                id="simple-print",
+            ),
+            pytest.param(
+                "from pyspark.sql import SparkSession\n"
+                "spark = SparkSession.builder.getOrCreate()\n"
+                "df = spark.range(5)\n"
+                'print(f"Row count: {df.count()}")\n',
+                "Row count: 5",
+                True,
+                id="spark-code",
+            ),
+            pytest.param(
+                "x = 1 / 0  # This will raise ZeroDivisionError",
+                "ZeroDivisionError",
+                False,
+                id="error-handling",
+            ),
+        ],
+    )
+    def test_file_execution(self, shared_context, tmp_path, code, expected_substring, should_succeed):
+        """Should execute Python files on the shared context (success and failure cases)."""
+        script = tmp_path / "script.py"
+        script.write_text(code)
 
-        try:
-            result = run_python_file_on_databricks(
-                file_path=temp_path,
-                cluster_id=shared_context["cluster_id"],
-                context_id=shared_context["context_id"],
-                timeout=120,
-            )
+        result = run_python_file_on_databricks(
+            file_path=str(script),
+            cluster_id=shared_context["cluster_id"],
+            context_id=shared_context["context_id"],
+            timeout=120,
+        )
 
-            print("\n=== File Execution Result ===")
-            print(f"Success: {result.success}")
-            print(f"Output: {result.output}")
+        print("\n=== File Execution Result ===")
+        print(f"Success: {result.success}")
+        print(f"Output: {result.output}")
+        print(f"Error: {result.error[:200] if result.error else None}")
 
+        if should_succeed:
             assert result.success, f"Execution failed: {result.error}"
-            assert "Hello from file!" in result.output
-
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
-
-    def test_spark_code(self, shared_context):
-        """Should execute Spark code."""
-        code = """
-from pyspark.sql import SparkSession
-spark = SparkSession.builder.getOrCreate()
-df = spark.range(5)
-print(f"Row count: {df.count()}")
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(code)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            result = run_python_file_on_databricks(
-                file_path=temp_path,
-                cluster_id=shared_context["cluster_id"],
-                context_id=shared_context["context_id"],
-                timeout=120,
-            )
-
-            print("\n=== Spark Execution Result ===")
-            print(f"Success: {result.success}")
-            print(f"Output: {result.output}")
-
-            assert result.success, f"Spark execution failed: {result.error}"
-            assert "Row count: 5" in result.output
-
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
-
-    def test_error_handling(self, shared_context):
-        """Should capture Python errors with details."""
-        code = "x = 1 / 0  # This will raise ZeroDivisionError"
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".py", delete=False) as f:
-            f.write(code)
-            f.flush()
-            temp_path = f.name
-
-        try:
-            result = run_python_file_on_databricks(
-                file_path=temp_path,
-                cluster_id=shared_context["cluster_id"],
-                context_id=shared_context["context_id"],
-                timeout=120,
-            )
-
-            print("\n=== Error Handling Result ===")
-            print(f"Success: {result.success}")
-            print(f"Error: {result.error[:200] if result.error else None}...")
-
-            assert not result.success, "Should have failed with division by zero"
+            assert expected_substring in result.output
+        else:
+            assert not result.success, "Should have failed"
             assert result.error is not None
-            assert "ZeroDivisionError" in result.error
-
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+            assert expected_substring in result.error
 
     def test_file_not_found(self):
         """Should handle missing file gracefully (no cluster needed)."""